@@ -1,16 +1,18 @@
-from typing import Dict, List
+from typing import Dict, List, Optional
 from random import randint
 from functools import reduce
 from copy import deepcopy
+from math import pi
 
 from ackley.phenotypes import FloatPhenotype, FloatPairPhenotype
 from ackley.genotypes import FloatGenotype, FloatPairGenotype
 from ackley.util import DataType
 from genetic_framework.chromosome import Chromosome
+from genetic_framework.rng import rng
 
 
 class FloatChromosome(Chromosome[FloatPhenotype, FloatGenotype]):
-    def __init__(self, custom_data: Dict = {}) -> None:
+    def __init__(self, custom_data: Optional[Dict] = None) -> None:
         super().__init__(custom_data)
 
         n: int = self.custom_data['n']
@@ -18,10 +20,13 @@ class FloatChromosome(Chromosome[FloatPhenotype, FloatGenotype]):
 
     def initialize(self) -> None:
         n: int = self.custom_data['n']
+        lower_bound: float = self.custom_data['lower_bound']
+        upper_bound: float = self.custom_data['upper_bound']
 
+        values = rng.uniform(lower_bound, upper_bound, n).tolist()
         self._genotypes = [FloatGenotype(self.custom_data) for _ in range(n)]
-        for genotype in self._genotypes:
-            genotype.initialize()
+        for genotype, value in zip(self._genotypes, values):
+            genotype.data = value
 
     @staticmethod
     def genotype_to_phenotype(gene: FloatGenotype, **_) -> FloatPhenotype:
@@ -61,6 +66,9 @@ class FloatChromosome(Chromosome[FloatPhenotype, FloatGenotype]):
             self.phenotype_to_genotype(phenotype) for phenotype in phenotypes
         ]
 
+    def clone(self) -> 'FloatChromosome':
+        return self.clone_gene_list()
+
     def __str__(self) -> str:
         return str(self._genotypes)
 
@@ -70,7 +78,7 @@ class FloatChromosome(Chromosome[FloatPhenotype, FloatGenotype]):
 
 class AdaptiveStepFloatChromosome(Chromosome[FloatPairPhenotype,
                                              FloatPairGenotype]):
-    def __init__(self, custom_data: Dict = {}) -> None:
+    def __init__(self, custom_data: Optional[Dict] = None) -> None:
         super().__init__(custom_data)
         n: int = self.custom_data['n']
 
@@ -80,12 +88,16 @@ class AdaptiveStepFloatChromosome(Chromosome[FloatPairPhenotype,
 
     def initialize(self) -> None:
         n: int = self.custom_data['n']
+        lower_bound: float = self.custom_data['lower_bound']
+        upper_bound: float = self.custom_data['upper_bound']
+        step_size: float = self.custom_data['step_size']
 
+        values = rng.uniform(lower_bound, upper_bound, n).tolist()
         self._genotypes = [
             FloatPairGenotype(self.custom_data) for _ in range(n)
         ]
-        for genotype in self._genotypes:
-            genotype.initialize()
+        for genotype, value in zip(self._genotypes, values):
+            genotype.data = (value, step_size)
 
     @staticmethod
     def genotype_to_phenotype(gene: FloatPairGenotype,
@@ -127,6 +139,9 @@ class AdaptiveStepFloatChromosome(Chromosome[FloatPairPhenotype,
             self.phenotype_to_genotype(phenotype) for phenotype in phenotypes
         ]
 
+    def clone(self) -> 'AdaptiveStepFloatChromosome':
+        return self.clone_gene_list()
+
     def __str__(self) -> str:
         return str(self._genotypes)
 
@@ -135,7 +150,7 @@ class AdaptiveStepFloatChromosome(Chromosome[FloatPairPhenotype,
 
 
 class CovarianceFloatChromosome(Chromosome[FloatPhenotype, FloatGenotype]):
-    def __init__(self, custom_data: Dict = {}) -> None:
+    def __init__(self, custom_data: Optional[Dict] = None) -> None:
         super().__init__(custom_data)
 
         n: int = self.custom_data['n']
@@ -158,6 +173,14 @@ class CovarianceFloatChromosome(Chromosome[FloatPhenotype, FloatGenotype]):
         k: int = int(n * (n - 1) / 2)
         size: int = 2 * n + k
 
+        lower_bound: float = self.custom_data['lower_bound']
+        upper_bound: float = self.custom_data['upper_bound']
+        step_size: float = self.custom_data['step_size']
+
+        values = rng.uniform(lower_bound, upper_bound, n).tolist()
+        values += [step_size] * n
+        values += rng.uniform(-pi, pi, k).tolist()
+
         self._genotypes = [
             FloatGenotype(self.custom_data) for _ in range(size)
         ]
@@ -169,7 +192,7 @@ class CovarianceFloatChromosome(Chromosome[FloatPhenotype, FloatGenotype]):
             else:
                 self._genotypes[i].type = DataType.ROTATION_ANGLE
 
-            self._genotypes[i].initialize()
+            self._genotypes[i].data = values[i]
 
     @staticmethod
     def genotype_to_phenotype(gene: FloatGenotype, **_) -> FloatPhenotype:
@@ -214,6 +237,9 @@ class CovarianceFloatChromosome(Chromosome[FloatPhenotype, FloatGenotype]):
             self.phenotype_to_genotype(phenotype) for phenotype in phenotypes
         ]
 
+    def clone(self) -> 'CovarianceFloatChromosome':
+        return self.clone_gene_list()
+
     def __str__(self) -> str:
         return str(self._genotypes)
 
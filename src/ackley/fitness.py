@@ -1,43 +1,56 @@
-from typing import Type, List
+from typing import Type, List, Dict, Tuple
 from abc import ABC
 from math import cos, exp, sqrt, e
 
+from genetic_framework.custom_data import CustomDataHolder
 from genetic_framework.fitness import FitnessComputer
 from ackley.chromosomes import FloatChromosome, AdaptiveStepFloatChromosome, CovarianceFloatChromosome
 from ackley.util import ackley_function
 
 
-class AckleyFitnessComputer(FitnessComputer[FloatChromosome], ABC):
+class AckleyConstantsHolder(CustomDataHolder):
+    """Keeps the Ackley function constants (c1, c2, c3) and n taken from
+    custom_data once, when it is set, instead of looking them up on every
+    fitness computation."""
+    _constants: Tuple[float, float, float] = (0.0, 0.0, 0.0)
+    _n: int = 0
+
+    @classmethod
+    def set_custom_data(cls, custom_data: Dict) -> None:
+        super().set_custom_data(custom_data)
+        cls._constants = (custom_data['c1'], custom_data['c2'],
+                          custom_data['c3'])
+        cls._n = custom_data['n']
+
+
+class AckleyFitnessComputer(AckleyConstantsHolder,
+                            FitnessComputer[FloatChromosome], ABC):
     @classmethod
     def fitness(cls: Type, chromosome: FloatChromosome) -> float:
-        c1: float = cls.custom_data['c1']
-        c2: float = cls.custom_data['c2']
-        c3: float = cls.custom_data['c3']
+        c1, c2, c3 = cls._constants
         data = list(map(lambda gene: gene.data, chromosome.genotypes))
 
         return ackley_function(c1, c2, c3, data)
 
 
 class AdaptiveStepAckleyFitnessComputer(
-        FitnessComputer[AdaptiveStepFloatChromosome], ABC):
+        AckleyConstantsHolder, FitnessComputer[AdaptiveStepFloatChromosome],
+        ABC):
     @classmethod
     def fitness(cls: Type, chromosome: AdaptiveStepFloatChromosome) -> float:
-        c1: float = cls.custom_data['c1']
-        c2: float = cls.custom_data['c2']
-        c3: float = cls.custom_data['c3']
+        c1, c2, c3 = cls._constants
         data = list(map(lambda gene: gene.data[0], chromosome.genotypes))
 
         return ackley_function(c1, c2, c3, data)
 
 
 class CovarianceAckleyFitnessComputer(
-        FitnessComputer[CovarianceFloatChromosome], ABC):
+        AckleyConstantsHolder, FitnessComputer[CovarianceFloatChromosome],
+        ABC):
     @classmethod
     def fitness(cls: Type, chromosome: CovarianceFloatChromosome) -> float:
-        n: int = cls.custom_data['n']
-        c1: float = cls.custom_data['c1']
-        c2: float = cls.custom_data['c2']
-        c3: float = cls.custom_data['c3']
+        n = cls._n
+        c1, c2, c3 = cls._constants
         data = list(map(lambda gene: gene.data, chromosome.genotypes[:n]))
 
         return ackley_function(c1, c2, c3, data)
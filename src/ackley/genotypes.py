@@ -1,4 +1,4 @@
-from typing import Dict, Tuple
+from typing import Dict, Tuple, Optional
 from random import uniform
 from math import pi
 
@@ -7,7 +7,7 @@ from ackley.util import DataType
 
 
 class FloatGenotype(Genotype[float]):
-    def __init__(self, custom_data: Dict = {}) -> None:
+    def __init__(self, custom_data: Optional[Dict] = None) -> None:
         super().__init__(custom_data)
         self.type: DataType = DataType.VARIABLE
         self._data: float = 0.0
@@ -49,7 +49,7 @@ class FloatGenotype(Genotype[float]):
 
 
 class FloatPairGenotype(Genotype[Tuple[float, float]]):
-    def __init__(self, custom_data: Dict = {}) -> None:
+    def __init__(self, custom_data: Optional[Dict] = None) -> None:
         super().__init__(custom_data)
         self._data: Tuple[float, float] = (0.0, 0.0)
 
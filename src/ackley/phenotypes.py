@@ -1,11 +1,11 @@
-from typing import Dict, Tuple
+from typing import Dict, Tuple, Optional
 
 from genetic_framework.chromosome import Phenotype
 from ackley.util import DataType
 
 
 class FloatPhenotype(Phenotype[float]):
-    def __init__(self, custom_data: Dict = {}) -> None:
+    def __init__(self, custom_data: Optional[Dict] = None) -> None:
         super().__init__(custom_data)
         self._data: float = 0.0
         self.type: DataType = DataType.VARIABLE
@@ -35,7 +35,7 @@ class FloatPhenotype(Phenotype[float]):
 
 
 class FloatPairPhenotype(Phenotype[Tuple[float, float]]):
-    def __init__(self, custom_data: Dict = {}) -> None:
+    def __init__(self, custom_data: Optional[Dict] = None) -> None:
         super().__init__(custom_data)
         self._data: Tuple[float, float] = (0.0, 0.0)
 
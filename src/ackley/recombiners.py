@@ -10,6 +10,8 @@ from ackley.util import lerp, clamp
 
 
 class MidPointRecombiner(Recombiner[FloatChromosome], ABC):
+    deterministic = True
+
     @classmethod
     def recombine(cls: Type, chromosome1: FloatChromosome,
                   chromosome2: FloatChromosome) -> FloatChromosome:
@@ -21,7 +23,6 @@ class MidPointRecombiner(Recombiner[FloatChromosome], ABC):
         for i in range(len(new_genes)):
             new_genes[i].data = (genes1[i].data + genes2[i].data) / 2
 
-        new_chromosome.genotypes = new_genes
         return new_chromosome
 
 
@@ -55,7 +56,6 @@ class AdaptiveStepMidPointRecombiner(Recombiner[AdaptiveStepFloatChromosome],
 
             new_genes[i].data = (new_value, new_delta)
 
-        new_chromosome.genotypes = new_genes
         return new_chromosome
 
 
@@ -83,5 +83,4 @@ class CovarianceMidPointRecombiner(Recombiner[CovarianceFloatChromosome], ABC):
         for i in range(len(new_genes)):
             new_genes[i].data = lerp(t, genes1[i].data, genes2[i].data)
 
-        new_chromosome.genotypes = new_genes
         return new_chromosome
@@ -1,16 +1,42 @@
-from typing import Dict, List, Type
+from typing import Dict, List, Type, Optional
 from random import randint
+from array import array
 from functools import reduce
 from copy import deepcopy
 
+import numpy as np  #type: ignore
+
 from eight_queens.phenotypes import QueenPositionPhenotype
 from eight_queens.genotypes import BitStringGenotype, IntGenotype
 from genetic_framework.chromosome import Chromosome
+from genetic_framework.rng import rng
+
+
+def genes_key(values: List[int], chess_size: int) -> bytes:
+    """Packs gene values (rows in [0, chess_size)) one byte each, or two
+    bytes each on boards bigger than 256, to be used as content_key."""
+    return array('B' if chess_size <= 256 else 'H', values).tobytes()
+
+
+def genes_dtype(chess_size: int) -> np.dtype:
+    """Returns the smallest signed integer type holding gene values (rows in
+    [0, chess_size)), so their differences fit in it too."""
+    if chess_size <= 128:
+        return np.dtype(np.int8)
+    return np.dtype(np.int16 if chess_size <= 32768 else np.int64)
+
+
+def stack_genes(values: List[List[int]]) -> np.ndarray:
+    """Stacks the gene values (queen rows, one list per chromosome) into a
+    single (len(values), chess_size) int matrix, one row per chromosome, of
+    the smallest type fitting them (see genes_dtype)."""
+    chess_size = len(values[0]) if values else 1
+    return np.array(values, dtype=genes_dtype(chess_size))
 
 
 class BitStringChromosome(Chromosome[QueenPositionPhenotype,
                                      BitStringGenotype]):
-    def __init__(self, custom_data: Dict = {}) -> None:
+    def __init__(self, custom_data: Optional[Dict] = None) -> None:
         super().__init__(custom_data)
         self._genotypes: List[BitStringGenotype] = []
 
@@ -20,24 +46,30 @@ class BitStringChromosome(Chromosome[QueenPositionPhenotype,
         self._genotypes = []
         for i in range(chess_size):
             new_gene = BitStringGenotype(self.custom_data)
-            new_data = randint(0, chess_size - 1)
-            new_gene.data = "{:032b}".format(new_data)
+            new_gene.value = randint(0, chess_size - 1)
             self._genotypes.append(new_gene)
 
     @classmethod
     def genotype_to_phenotype(cls: Type, gene: BitStringGenotype,
                               **kwargs) -> QueenPositionPhenotype:
         new_phenotype = QueenPositionPhenotype(gene.custom_data)
-        new_phenotype.data = (int(gene.data, 2), kwargs['index'])
+        new_phenotype.data = (gene.value, kwargs['index'])
         return new_phenotype
 
     @classmethod
     def phenotype_to_genotype(cls: Type, phenotype: QueenPositionPhenotype,
                               **kwargs) -> BitStringGenotype:
         new_genotype = BitStringGenotype(phenotype.custom_data)
-        new_genotype.data = "{:032b}".format(phenotype.data[0])
+        new_genotype.value = phenotype.data[0]
         return new_genotype
 
+    @staticmethod
+    def stack(chromosomes: List['BitStringChromosome']) -> np.ndarray:
+        """Returns the gene values of the given chromosomes stacked by
+        stack_genes."""
+        return stack_genes([[gene.value for gene in chromosome._genotypes]
+                            for chromosome in chromosomes])
+
     @property
     def genotypes(self) -> List[BitStringGenotype]:
         return self._genotypes
@@ -51,7 +83,7 @@ class BitStringChromosome(Chromosome[QueenPositionPhenotype,
                 'Tried to set BitStringChromosome genotypes with wrong number of genes ({}). Expected {}.'
                 .format(len(genes), chess_size))
 
-        values = [int(gene.data, 2) for gene in genes]
+        values = [gene.value for gene in genes]
 
         for value in values:
             if value < 0 or value >= chess_size:
@@ -75,6 +107,13 @@ class BitStringChromosome(Chromosome[QueenPositionPhenotype,
             self.phenotype_to_genotype(phenotype) for phenotype in _phenotypes
         ]
 
+    def content_key(self) -> bytes:
+        return genes_key([gene.value for gene in self._genotypes],
+                         self.custom_data['chess_size'])
+
+    def clone(self) -> 'BitStringChromosome':
+        return self.clone_gene_list()
+
     def __str__(self) -> str:
         return str(self.genotypes)
 
@@ -84,7 +123,7 @@ class BitStringChromosome(Chromosome[QueenPositionPhenotype,
 
 class IntPermutationChromosome(Chromosome[QueenPositionPhenotype,
                                           IntGenotype]):
-    def __init__(self, custom_data: Dict = {}) -> None:
+    def __init__(self, custom_data: Optional[Dict] = None) -> None:
         super().__init__(custom_data)
         self._genotypes: List[IntGenotype] = []
 
@@ -104,6 +143,32 @@ class IntPermutationChromosome(Chromosome[QueenPositionPhenotype,
             self._genotypes[i], self._genotypes[random_swap_position] = \
                 self._genotypes[random_swap_position], self._genotypes[i]
 
+    @classmethod
+    def initialize_batch(
+            cls: Type, n: int,
+            custom_data: Dict) -> List['IntPermutationChromosome']:
+        # Same permutation as initialize (Sattolo's algorithm, so a single
+        # cycle), drawn for all n chromosomes at once: each column i is
+        # swapped with a random later column, one random draw per column
+        chess_size: int = custom_data['chess_size']
+        matrix = np.tile(np.arange(chess_size), (n, 1))
+        rows = np.arange(n)
+        for i in range(chess_size - 1):
+            swap_positions = rng.integers(i + 1, chess_size, n)
+            matrix[rows, i], matrix[rows, swap_positions] = \
+                matrix[rows, swap_positions], matrix[rows, i]
+        permutations = matrix.tolist()
+
+        chromosomes = []
+        for permutation in permutations:
+            chromosome = cls(custom_data)
+            for value in permutation:
+                new_gene = IntGenotype(custom_data)
+                new_gene.data = value
+                chromosome._genotypes.append(new_gene)
+            chromosomes.append(chromosome)
+        return chromosomes
+
     @classmethod
     def genotype_to_phenotype(cls: Type, gene: IntGenotype,
                               **kwargs) -> QueenPositionPhenotype:
@@ -118,6 +183,13 @@ class IntPermutationChromosome(Chromosome[QueenPositionPhenotype,
         new_gene.data = phenotype.data[0]
         return new_gene
 
+    @staticmethod
+    def stack(chromosomes: List['IntPermutationChromosome']) -> np.ndarray:
+        """Returns the gene values of the given chromosomes stacked by
+        stack_genes."""
+        return stack_genes([[gene.data for gene in chromosome._genotypes]
+                            for chromosome in chromosomes])
+
     @property
     def genotypes(self) -> List[IntGenotype]:
         return self._genotypes
@@ -157,6 +229,13 @@ class IntPermutationChromosome(Chromosome[QueenPositionPhenotype,
             for i in range(len(phenotypes))
         ]
 
+    def content_key(self) -> bytes:
+        return genes_key([gene.data for gene in self._genotypes],
+                         self.custom_data['chess_size'])
+
+    def clone(self) -> 'IntPermutationChromosome':
+        return self.clone_gene_list()
+
     def __str__(self) -> str:
         return str(self._genotypes)
 
@@ -1,8 +1,12 @@
 from typing import Type, List, Tuple
 from abc import ABC
+from functools import lru_cache
+
+import numpy as np  #type: ignore
 
 from genetic_framework.fitness import FitnessComputer
 from eight_queens.phenotypes import QueenPositionPhenotype
+from eight_queens.kernels import queen_attacks_pop
 from eight_queens.chromosomes import *
 
 
@@ -29,12 +33,45 @@ def count_queen_attacks(phenotypes: List[QueenPositionPhenotype]) -> int:
     return attacking_queens_count // 2
 
 
+@lru_cache(maxsize=None)
+def column_pairs(chess_size: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Returns, for every pair of columns of the board, the first column, the
+    second one (always after the first) and their distance, as three read
+    only arrays built once per chess_size."""
+    column1, column2 = np.triu_indices(chess_size, 1)
+    deltas = column2 - column1
+    for indices in (column1, column2, deltas):
+        indices.setflags(write=False)
+    return column1, column2, deltas
+
+
+def count_queen_attacks_batch(rows: np.ndarray) -> np.ndarray:
+    """Returns the number of attacking queen pairs of every board in rows
+    (one board per row, holding the queen row of each column), all boards
+    counted at once."""
+    if len(rows) == 0:
+        # Stacking no boards gives no columns to pair
+        return np.empty(0, dtype=np.int64)
+
+    column1, column2, deltas = column_pairs(rows.shape[1])
+    attacks = np.empty(rows.shape[0], dtype=np.int64)
+    queen_attacks_pop(rows, column1, column2, deltas, attacks)
+    return attacks
+
+
 class BitStringFitnessComputer(FitnessComputer[BitStringChromosome], ABC):
     @classmethod
     def fitness(cls: Type, chromosome: BitStringChromosome) -> float:
         attacks = count_queen_attacks(chromosome.phenotypes)
         return 1 / (1 + float(attacks))
 
+    @classmethod
+    def fitness_batch(cls: Type,
+                      chromosomes: List[BitStringChromosome]) -> np.ndarray:
+        attacks = count_queen_attacks_batch(
+            BitStringChromosome.stack(chromosomes))
+        return 1 / (1 + attacks.astype(np.float64))
+
 
 class BooleanBitStringFitnessComputer(FitnessComputer[BitStringChromosome],
                                       ABC):
@@ -43,6 +80,14 @@ class BooleanBitStringFitnessComputer(FitnessComputer[BitStringChromosome],
         attacks = count_queen_attacks(chromosome.phenotypes)
         return 1.0 if attacks == 0 else 0.0
 
+    @classmethod
+    def fitness_batch(cls: Type,
+                      chromosomes: List[BitStringChromosome]) -> np.ndarray:
+        attacks = count_queen_attacks_batch(
+            BitStringChromosome.stack(chromosomes))
+        fits: np.ndarray = (attacks == 0).astype(np.float64)
+        return fits
+
 
 class IntPermutationFitnessComputer(FitnessComputer[IntPermutationChromosome],
                                     ABC):
@@ -51,6 +96,14 @@ class IntPermutationFitnessComputer(FitnessComputer[IntPermutationChromosome],
         attacks = count_queen_attacks(chromosome.phenotypes)
         return 1 / (1 + float(attacks))
 
+    @classmethod
+    def fitness_batch(
+            cls: Type,
+            chromosomes: List[IntPermutationChromosome]) -> np.ndarray:
+        attacks = count_queen_attacks_batch(
+            IntPermutationChromosome.stack(chromosomes))
+        return 1 / (1 + attacks.astype(np.float64))
+
 
 class BooleanIntPermutationFitnessComputer(
         FitnessComputer[IntPermutationChromosome], ABC):
@@ -58,3 +111,12 @@ class BooleanIntPermutationFitnessComputer(
     def fitness(cls: Type, chromosome: IntPermutationChromosome) -> float:
         attacks = count_queen_attacks(chromosome.phenotypes)
         return 1.0 if attacks == 0 else 0.0
+
+    @classmethod
+    def fitness_batch(
+            cls: Type,
+            chromosomes: List[IntPermutationChromosome]) -> np.ndarray:
+        attacks = count_queen_attacks_batch(
+            IntPermutationChromosome.stack(chromosomes))
+        fits: np.ndarray = (attacks == 0).astype(np.float64)
+        return fits
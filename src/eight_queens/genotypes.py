@@ -1,41 +1,50 @@
-from typing import Dict
+from typing import Dict, Optional
 from random import randint
 
 from genetic_framework.chromosome import Genotype
 
 
 class BitStringGenotype(Genotype[str]):
+    """Gene holding a row as a STRING_SIZE bits string. The row is stored as
+    an int (value) and only formatted as a bit string when data is read."""
     STRING_SIZE = 32
 
-    def __init__(self, custom_data: Dict = {}) -> None:
+    def __init__(self, custom_data: Optional[Dict] = None) -> None:
         super().__init__(custom_data)
-        self._data: str = ""
+        self._value: int = 0
 
     def initialize(self) -> None:
         chess_size = self.custom_data['chess_size']
-        row = randint(0, chess_size - 1)
-        self._data = "{:032b}".format(row)
+        self._value = randint(0, chess_size - 1)
 
     @property
     def data(self) -> str:
-        return self._data
+        return "{:032b}".format(self._value)
 
     @data.setter
     def data(self, new_data: str) -> None:
-        chess_size = self.custom_data['chess_size']
-
         if len(new_data) != BitStringGenotype.STRING_SIZE:
             raise ValueError(
                 'Tried to set BitStringGenotype data with data of wrong size ({}). Should be {}.'
                 .format(len(new_data), BitStringGenotype.STRING_SIZE))
 
-        integer_data = int(new_data, 2)
-        if integer_data < 0 or integer_data >= chess_size:
+        self.value = int(new_data, 2)
+
+    @property
+    def value(self) -> int:
+        """Integer the gene's bit string encodes."""
+        return self._value
+
+    @value.setter
+    def value(self, new_value: int) -> None:
+        chess_size = self.custom_data['chess_size']
+
+        if new_value < 0 or new_value >= chess_size:
             raise ValueError(
                 'Tried to set BitStringGenotype data with ({}). Should be [{}, {}]'
-                .format(integer_data, 0, chess_size - 1))
+                .format(new_value, 0, chess_size - 1))
 
-        self._data = new_data
+        self._value = new_value
 
     def __str__(self) -> str:
         return str(self.data)
@@ -45,7 +54,7 @@ class BitStringGenotype(Genotype[str]):
 
 
 class IntGenotype(Genotype[int]):
-    def __init__(self, custom_data: Dict = {}) -> None:
+    def __init__(self, custom_data: Optional[Dict] = None) -> None:
         super().__init__(custom_data)
         self._data: int = -1
 
@@ -0,0 +1,33 @@
+"""Array kernels used by the batched eight queens fitness computers,
+compiled through genetic_framework.jit.
+"""
+import numpy as np  #type: ignore
+
+from genetic_framework.jit import jit
+
+
+@jit(parallel=True)
+def queen_attacks_pop(rows: np.ndarray, column1: np.ndarray,
+                      column2: np.ndarray, deltas: np.ndarray,
+                      out: np.ndarray) -> None:
+    """Writes into out (pop) the number of attacking queen pairs of every row
+    of rows (pop, chess_size), each holding the queen row of every column.
+    column1 and column2 list the pairs of columns checked (column1 < column2)
+    and deltas their distances (column2 - column1)."""
+    distance = np.abs(rows[:, column1] - rows[:, column2])
+    out[:] = np.sum((distance == 0) | (distance == deltas), axis=1)
+
+
+def warm_up() -> None:
+    """Calls every kernel once over tiny arrays of the same types the fitness
+    computers use, so numba compiles (or loads from its cache) them before
+    the first generation instead of during it."""
+    # int8 rows, as stacked for boards of up to 128 queens
+    rows = np.zeros((2, 2), dtype=np.int8)
+    # Read only pairs, as cached by fitness.column_pairs
+    column1, column2 = np.triu_indices(2, 1)
+    deltas = column2 - column1
+    for indices in (column1, column2, deltas):
+        indices.setflags(write=False)
+    queen_attacks_pop(rows, column1, column2, deltas,
+                      np.empty(2, dtype=np.int64))
@@ -1,10 +1,10 @@
-from typing import Tuple, Dict
+from typing import Tuple, Dict, Optional
 
 from genetic_framework.chromosome import Phenotype
 
 
 class QueenPositionPhenotype(Phenotype[Tuple[int, int]]):
-    def __init__(self, custom_data: Dict = {}) -> None:
+    def __init__(self, custom_data: Optional[Dict] = None) -> None:
         super().__init__(custom_data)
         self._data: Tuple[int, int] = (-1, -1)
 
@@ -5,13 +5,15 @@ from abc import ABC
 from genetic_framework.recombiner import Recombiner
 from eight_queens.chromosomes import *
 from eight_queens.genotypes import IntGenotype
+from eight_queens.utils import ChessSizeHolder
 
 
-class BitStringCutCrossfillRecombiner(Recombiner[BitStringChromosome], ABC):
+class BitStringCutCrossfillRecombiner(ChessSizeHolder,
+                                      Recombiner[BitStringChromosome], ABC):
     @classmethod
     def recombine(cls: Type, chromosome1: BitStringChromosome,
                   chromosome2: BitStringChromosome) -> BitStringChromosome:
-        chess_size = cls.custom_data['chess_size']
+        chess_size = cls._chess_size
 
         new_chromosome = BitStringChromosome(chromosome1.custom_data)
         genes1 = chromosome1.genotypes
@@ -24,7 +26,8 @@ class BitStringCutCrossfillRecombiner(Recombiner[BitStringChromosome], ABC):
         return new_chromosome
 
 
-class IntPermutationRecombiner(Recombiner[IntPermutationChromosome], ABC):
+class IntPermutationRecombiner(ChessSizeHolder,
+                               Recombiner[IntPermutationChromosome], ABC):
     # PMX crossover algorithm
 
     @classmethod
@@ -43,7 +46,7 @@ class IntPermutationRecombiner(Recombiner[IntPermutationChromosome], ABC):
             cls: Type['IntPermutationRecombiner'],
             chromosome1: IntPermutationChromosome,
             chromosome2: IntPermutationChromosome) -> IntPermutationChromosome:
-        chess_size = cls.custom_data['chess_size']
+        chess_size = cls._chess_size
 
         new_chromosome = IntPermutationChromosome(chromosome1.custom_data)
         chromo1_data = list(map(lambda gene: gene.data, chromosome1.genotypes))
@@ -1,20 +1,32 @@
-from typing import List
+from typing import Dict
 from random import random, randint
 
+import numpy as np  #type: ignore
+
 from eight_queens.chromosomes import *
+from genetic_framework.custom_data import CustomDataHolder
 from genetic_framework.individual import Individual
 
 
+class ChessSizeHolder(CustomDataHolder):
+    """Keeps chess_size taken from custom_data once, when it is set, so
+    operators don't look it up on every call."""
+    _chess_size: int = 0
+
+    @classmethod
+    def set_custom_data(cls, custom_data: Dict) -> None:
+        super().set_custom_data(custom_data)
+        cls._chess_size = custom_data['chess_size']
+
+
 def print_chess_board(chromosome: Chromosome) -> None:
     chess_size = chromosome.custom_data['chess_size']
-    queen_positions = [(pheno.data[0], pheno.data[1])
-                       for pheno in chromosome.phenotypes]
-
-    board: List[List[str]] = []
-    for i in range(chess_size):
-        board.append([])
-        for j in range(chess_size):
-            board[i].append('*' if (i, j) in queen_positions else '_')
+    queen_positions = [pheno.data for pheno in chromosome.phenotypes]
+
+    # Queens are scattered over an empty board with a single fancy indexing
+    board = np.full((chess_size, chess_size), '_')
+    if len(queen_positions) > 0:
+        board[tuple(np.array(queen_positions).T)] = '*'
 
     final_str = '\n'.join([' '.join(row) for row in board])
     print(final_str)
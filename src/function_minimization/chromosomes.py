@@ -1,27 +1,38 @@
-from typing import Dict, List
-from random import uniform
-from copy import deepcopy
+from typing import Dict, List, Optional
+
+import numpy as np  #type: ignore
 
 from function_minimization.phenotypes import FloatPhenotype
 from function_minimization.genotypes import FloatGenotype
 from genetic_framework.chromosome import Chromosome
+from genetic_framework.rng import rng
 
 
 class FloatVectorChromosome(Chromosome[FloatPhenotype, FloatGenotype]):
-    def __init__(self, custom_data: Dict = {}) -> None:
+    """Chromosome that keeps its genes in a single contiguous float64 array
+    (data property). FloatGenotype/FloatPhenotype objects are only built on
+    demand by the genotypes/phenotypes properties, so operators should work
+    over data directly."""
+    def __init__(self, custom_data: Optional[Dict] = None) -> None:
         super().__init__(custom_data)
-        self._genotypes: List[FloatGenotype] = []
+        vector_size: int = self.custom_data['vector_size']
+        self._data: np.ndarray = np.zeros(vector_size)
 
     def initialize(self) -> None:
         vector_size = self.custom_data['vector_size']
         lower_bound = self.custom_data['parameter_lower_bound']
         upper_bound = self.custom_data['parameter_upper_bound']
 
-        self._genotypes = []
-        for _ in range(vector_size):
-            new_gene = FloatGenotype(self.custom_data)
-            new_gene.data = uniform(lower_bound, upper_bound)
-            self._genotypes.append(new_gene)
+        self._data = rng.uniform(lower_bound, upper_bound, vector_size)
+
+    @staticmethod
+    def initialize_batch(n: int,
+                         custom_data: Dict) -> List['FloatVectorChromosome']:
+        # Genes of every chromosome drawn at once
+        genes = rng.uniform(custom_data['parameter_lower_bound'],
+                            custom_data['parameter_upper_bound'],
+                            (n, custom_data['vector_size']))
+        return FloatVectorChromosome.from_rows(custom_data, genes)
 
     @staticmethod
     def genotype_to_phenotype(gene: FloatGenotype, **kwargs) -> FloatPhenotype:
@@ -36,47 +47,104 @@ class FloatVectorChromosome(Chromosome[FloatPhenotype, FloatGenotype]):
         new_genotype.data = phenotype.data
         return new_genotype
 
+    @staticmethod
+    def from_data(custom_data: Dict,
+                  data: np.ndarray) -> 'FloatVectorChromosome':
+        """Builds a chromosome over the given float64 array without copying or
+        checking it, so callers must ensure it has vector_size genes inside the
+        parameter boundaries. Assign the data property to have it checked."""
+        # Fills the attributes directly instead of going through __init__,
+        # which would allocate a zeroed gene array only to replace it
+        new_chromosome: FloatVectorChromosome = FloatVectorChromosome.__new__(
+            FloatVectorChromosome)
+        new_chromosome.custom_data = custom_data
+        new_chromosome._data = data
+        return new_chromosome
+
+    @staticmethod
+    def from_rows(custom_data: Dict,
+                  genes: np.ndarray) -> List['FloatVectorChromosome']:
+        """Builds a chromosome over a copy of every row of genes (a (n,
+        vector_size) float64 matrix), unchecked as in from_data. Rows are
+        copied rather than viewed, so a long lived chromosome doesn't keep
+        the whole matrix alive."""
+        return [
+            FloatVectorChromosome.from_data(custom_data, data.copy())
+            for data in genes
+        ]
+
+    @staticmethod
+    def stack(chromosomes: List['FloatVectorChromosome']) -> np.ndarray:
+        """Returns the genes of the given chromosomes as a single
+        (len(chromosomes), vector_size) float64 matrix (one row each)."""
+        return np.stack([chromosome.data for chromosome in chromosomes])
+
+    @staticmethod
+    def format_many(chromosomes: List['FloatVectorChromosome']) -> str:
+        # A single tolist over the stacked genes instead of one per chromosome
+        rows = FloatVectorChromosome.stack(chromosomes).tolist()
+        return '\n'.join(map(str, rows))
+
     @property
-    def genotypes(self) -> List[FloatGenotype]:
-        return self._genotypes
+    def data(self) -> np.ndarray:
+        return self._data
 
-    @genotypes.setter
-    def genotypes(self, genes: List[FloatGenotype]) -> None:
+    @data.setter
+    def data(self, new_data: np.ndarray) -> None:
         vector_size = self.custom_data['vector_size']
         lower_bound = self.custom_data['parameter_lower_bound']
         upper_bound = self.custom_data['parameter_upper_bound']
 
-        if len(genes) != vector_size:
+        if len(new_data) != vector_size:
             raise ValueError(
-                'Tried to set FloatParameterChromosome genotypes with wrong number of genes ({}). Expected {}.'
-                .format(len(genes), vector_size))
+                'Tried to set FloatParameterChromosome data with wrong number of genes ({}). Expected {}.'
+                .format(len(new_data), vector_size))
 
-        values = [gene.data for gene in genes]
+        new_data = np.asarray(new_data, dtype=np.float64)
+        if np.any(new_data < lower_bound) or np.any(new_data > upper_bound):
+            raise ValueError(
+                'Tried to set FloatParameterChromosome genes with gene out of boundaries ({}). Expected [{}, {}].'
+                .format(new_data, lower_bound, upper_bound))
 
-        for value in values:
-            if value < lower_bound or value > upper_bound:
-                raise ValueError(
-                    'Tried to set FloatParameterChromosome genes with gene out of boundaries ({}). Expected [{}, {}].'
-                    .format(value, lower_bound, upper_bound))
+        self._data = new_data
 
-        self._genotypes = deepcopy(genes)
+    @property
+    def genotypes(self) -> List[FloatGenotype]:
+        genes: List[FloatGenotype] = []
+        for value in self._data:
+            new_gene = FloatGenotype(self.custom_data)
+            new_gene.data = float(value)
+            genes.append(new_gene)
+
+        return genes
+
+    @genotypes.setter
+    def genotypes(self, genes: List[FloatGenotype]) -> None:
+        self.data = np.array([gene.data for gene in genes], dtype=np.float64)
 
     @property
     def phenotypes(self) -> List[FloatPhenotype]:
         return [
-            FloatVectorChromosome.genotype_to_phenotype(self.genotypes[i])
-            for i in range(len(self.genotypes))
+            FloatVectorChromosome.genotype_to_phenotype(gene)
+            for gene in self.genotypes
         ]
 
     @phenotypes.setter
     def phenotypes(self, _phenotypes: List[FloatPhenotype]) -> None:
-        self._genotypes = [
+        self.genotypes = [
             FloatVectorChromosome.phenotype_to_genotype(phenotype)
             for phenotype in _phenotypes
         ]
 
+    def clone(self) -> 'FloatVectorChromosome':
+        return FloatVectorChromosome.from_data(self.custom_data,
+                                               self._data.copy())
+
+    def content_key(self) -> bytes:
+        return self._data.tobytes()
+
     def __str__(self) -> str:
-        return str(self.genotypes)
+        return str(self._data.tolist())
 
     def __repr__(self) -> str:
         return self.__str__()
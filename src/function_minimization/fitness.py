@@ -1,22 +1,27 @@
 from typing import Type, List, Tuple
 from abc import ABC
 
+import numpy as np  #type: ignore
+
 from genetic_framework.fitness import FitnessComputer
-from function_minimization.genotypes import FloatGenotype
 from function_minimization.chromosomes import FloatVectorChromosome
+from function_minimization.kernels import rosenbrock_pop
 
 
 class ChallengeFitnessComputer(FitnessComputer[FloatVectorChromosome], ABC):
     @staticmethod
     def fitness(chromosome: FloatVectorChromosome) -> float:
-        vector_size = ChallengeFitnessComputer.custom_data['vector_size']
-        data: List[float] = [gene.data for gene in chromosome.genotypes]
+        x1 = chromosome.data[:-1]
+        x2 = chromosome.data[1:]
+
+        left = x2 - (x1**2)
+        right = (x1 - 1)
+        return float(np.sum((100.0 * (left**2)) + (right**2)))
 
-        total = 0.0
-        for i in range(vector_size - 1):
-            x1 = data[i]
-            x2 = data[i + 1]
-            left = x2 - (x1**2)
-            right = (x1 - 1)
-            total += (100.0 * (left**2)) + (right**2)
-        return total
+    @staticmethod
+    def fitness_batch(
+            chromosomes: List[FloatVectorChromosome]) -> np.ndarray:
+        fits = np.empty(len(chromosomes))
+        if len(chromosomes) > 0:
+            rosenbrock_pop(FloatVectorChromosome.stack(chromosomes), fits)
+        return fits
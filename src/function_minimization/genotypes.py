@@ -1,11 +1,13 @@
-from typing import Dict
+from typing import Dict, Optional
 from random import uniform
 
 from genetic_framework.chromosome import Genotype
 
 
 class FloatGenotype(Genotype[float]):
-    def __init__(self, custom_data: Dict = {}) -> None:
+    __slots__ = ('_data', )
+
+    def __init__(self, custom_data: Optional[Dict] = None) -> None:
         super().__init__(custom_data)
         self._data: float = 0.0
 
@@ -23,7 +25,7 @@ class FloatGenotype(Genotype[float]):
         lower_bound = self.custom_data['parameter_lower_bound']
         upper_bound = self.custom_data['parameter_upper_bound']
 
-        if self.data < lower_bound or self.data > upper_bound:
+        if new_data < lower_bound or new_data > upper_bound:
             raise ValueError(
                 'Tried to set FloatGenotype data with ({}). Should be [{}, {}]'
                 .format(new_data, lower_bound, upper_bound))
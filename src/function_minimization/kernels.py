@@ -0,0 +1,46 @@
+"""Array kernels used by the batched function minimization operators,
+compiled through genetic_framework.jit.
+"""
+import numpy as np  #type: ignore
+
+from genetic_framework.jit import jit
+
+
+@jit(parallel=True)
+def recombine_pop(genes1: np.ndarray, genes2: np.ndarray, alphas: np.ndarray,
+                  out: np.ndarray) -> None:
+    """Writes into out (pop, vector_size) the interpolation of every row of
+    genes1 with the same row of genes2, weighted by alphas (pop)."""
+    weights = alphas.reshape((-1, 1))
+    out[:] = weights * genes1 + (1.0 - weights) * genes2
+
+
+@jit(parallel=True)
+def mutate_values(values: np.ndarray, steps: np.ndarray, lower_bound: float,
+                  upper_bound: float) -> None:
+    """Moves every value by steps (in [-1, 1]) times the largest addition that
+    keeps it inside [lower_bound, upper_bound], modifying values inplace."""
+    max_addition = np.minimum(values - lower_bound, upper_bound - values)
+    values[:] = np.minimum(
+        np.maximum(values + steps * max_addition, lower_bound), upper_bound)
+
+
+@jit(parallel=True)
+def rosenbrock_pop(genes: np.ndarray, out: np.ndarray) -> None:
+    """Writes into out (pop) the Rosenbrock function of every row of genes
+    (pop, vector_size)."""
+    x1 = genes[:, :-1]
+    x2 = genes[:, 1:]
+    out[:] = np.sum(100.0 * (x2 - x1**2)**2 + (x1 - 1.0)**2, axis=1)
+
+
+def warm_up() -> None:
+    """Calls every kernel once over tiny arrays of the same types the
+    operators use, so numba compiles (or loads from its cache) them before
+    the first generation instead of during it. Worker processes started
+    afterwards find them in numba's cache."""
+    genes = np.zeros((2, 2))
+    values = np.zeros(2)
+    recombine_pop(genes, genes, values, np.empty_like(genes))
+    mutate_values(values, values, -1.0, 1.0)
+    rosenbrock_pop(genes, np.empty(2))
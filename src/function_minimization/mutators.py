@@ -1,28 +1,59 @@
 from math import sqrt
-from random import randint, uniform
 from abc import ABC
-from typing import Type
+from typing import Type, List, Dict, Tuple
+
+import numpy as np  #type: ignore
 
 from genetic_framework.mutator import Mutator
+from genetic_framework.rng import rng as shared_rng, scalar_random
 from function_minimization.chromosomes import FloatVectorChromosome
 from function_minimization.util import clamp
+from function_minimization.kernels import mutate_values
 
 
 class RandomizeGeneMutator(Mutator[FloatVectorChromosome], ABC):
+    # Random instance apart from the random module shared one, so single
+    # mutations don't go through it (still reseeded by genetic_framework.rng)
+    _random = scalar_random
+    # (vector_size, parameter_lower_bound, parameter_upper_bound) taken from
+    # custom_data once, when it is set
+    _bounds: Tuple[int, float, float] = (0, 0.0, 0.0)
+
+    @classmethod
+    def set_custom_data(cls, custom_data: Dict) -> None:
+        super().set_custom_data(custom_data)
+        cls._bounds = (custom_data['vector_size'],
+                       custom_data['parameter_lower_bound'],
+                       custom_data['parameter_upper_bound'])
+
     @classmethod
     def mutate_inplace(cls: Type, chromosome: FloatVectorChromosome) -> None:
-        vector_size: int = cls.custom_data['vector_size']
-        lower_bound: float = cls.custom_data['parameter_lower_bound']
-        upper_bound: float = cls.custom_data['parameter_upper_bound']
-        genes = chromosome.genotypes
+        vector_size, lower_bound, upper_bound = cls._bounds
+        genes = chromosome.data
 
-        gene_index = randint(0, vector_size - 1)
-        current_gene_value = genes[gene_index].data
+        gene_index = cls._random.randint(0, vector_size - 1)
+        current_gene_value = genes[gene_index]
         max_addition = min(current_gene_value - lower_bound,
                            upper_bound - current_gene_value)
-        new_gene_value = current_gene_value + uniform(-max_addition,
-                                                      max_addition)
-        new_gene_value = clamp(new_gene_value, lower_bound, upper_bound)
+        new_gene_value = current_gene_value + cls._random.uniform(
+            -max_addition, max_addition)
+        genes[gene_index] = clamp(new_gene_value, lower_bound, upper_bound)
+
+    @classmethod
+    def mutate_batch_inplace(
+            cls: Type,
+            chromosomes: List[FloatVectorChromosome],
+            rng: np.random.Generator = shared_rng) -> None:
+        vector_size, lower_bound, upper_bound = cls._bounds
+
+        gene_indexes = rng.integers(0, vector_size, len(chromosomes))
+        values = np.array([
+            chromosome.data[gene_index]
+            for (chromosome, gene_index) in zip(chromosomes, gene_indexes)
+        ])
+        steps = rng.uniform(-1.0, 1.0, len(chromosomes))
+        mutate_values(values, steps, lower_bound, upper_bound)
 
-        genes[gene_index].data = new_gene_value
-        chromosome.genotypes = genes
+        for (chromosome, gene_index, value) in zip(chromosomes, gene_indexes,
+                                                   values):
+            chromosome.data[gene_index] = value
@@ -1,10 +1,12 @@
-from typing import Dict
+from typing import Dict, Optional
 
 from genetic_framework.chromosome import Phenotype
 
 
 class FloatPhenotype(Phenotype[float]):
-    def __init__(self, custom_data: Dict = {}) -> None:
+    __slots__ = ('_data', )
+
+    def __init__(self, custom_data: Optional[Dict] = None) -> None:
         super().__init__(custom_data)
         self._data: float = 0.0
 
@@ -1,26 +1,78 @@
 from random import random
 from abc import ABC
+from typing import List, Tuple
+
+import numpy as np  #type: ignore
 
 from genetic_framework.recombiner import Recombiner
+from genetic_framework.rng import rng as shared_rng
 from function_minimization.chromosomes import FloatVectorChromosome
-from function_minimization.genotypes import FloatGenotype
+from function_minimization.kernels import recombine_pop
 
 
 class RandomInterpolationRecombiner(Recombiner[FloatVectorChromosome], ABC):
     @staticmethod
     def recombine(chromosome1: FloatVectorChromosome,
                   chromosome2: FloatVectorChromosome) -> FloatVectorChromosome:
-        vector_size = RandomInterpolationRecombiner.custom_data['vector_size']
-
-        new_chromosome = FloatVectorChromosome(chromosome1.custom_data)
-        genes1 = chromosome1.genotypes
-        genes2 = chromosome2.genotypes
+        custom_data = chromosome1.custom_data
 
         alpha = random()
-        mixed_genes = genes1[:]
-        for i in range(vector_size):
-            mixed_genes[i].data = alpha * genes1[i].data + (
-                1 - alpha) * genes2[i].data
+        new_data = np.empty_like(chromosome1.data)
+        np.multiply(chromosome1.data, alpha, out=new_data)
+        new_data += (1 - alpha) * chromosome2.data
+        # Interpolation never leaves the boundaries, clipping only absorbs
+        # floating point rounding
+        np.clip(new_data,
+                custom_data['parameter_lower_bound'],
+                custom_data['parameter_upper_bound'],
+                out=new_data)
+
+        return FloatVectorChromosome.from_data(custom_data, new_data)
+
+    @staticmethod
+    def recombine_batch(
+        couples: List[Tuple[FloatVectorChromosome, FloatVectorChromosome]],
+        rng: np.random.Generator = shared_rng
+    ) -> List[FloatVectorChromosome]:
+        genes1 = FloatVectorChromosome.stack(
+            [chromosome1 for (chromosome1, _) in couples])
+        genes2 = FloatVectorChromosome.stack(
+            [chromosome2 for (_, chromosome2) in couples])
+        alphas = rng.random(len(couples))
+        new_genes = np.empty_like(genes1)
+        recombine_pop(genes1, genes2, alphas, new_genes)
+
+        custom_data = couples[0][0].custom_data
+        np.clip(new_genes,
+                custom_data['parameter_lower_bound'],
+                custom_data['parameter_upper_bound'],
+                out=new_genes)
+
+        return FloatVectorChromosome.from_rows(custom_data, new_genes)
+
+
+class UniformCrossoverRecombiner(Recombiner[FloatVectorChromosome], ABC):
+    """Each child gene is taken from either parent with equal probability."""
+    @staticmethod
+    def recombine(chromosome1: FloatVectorChromosome,
+                  chromosome2: FloatVectorChromosome) -> FloatVectorChromosome:
+        mask = shared_rng.random(len(chromosome1.data)) < 0.5
+        new_data = np.where(mask, chromosome1.data, chromosome2.data)
+        return FloatVectorChromosome.from_data(chromosome1.custom_data,
+                                               new_data)
+
+    @staticmethod
+    def recombine_batch(
+        couples: List[Tuple[FloatVectorChromosome, FloatVectorChromosome]],
+        rng: np.random.Generator = shared_rng
+    ) -> List[FloatVectorChromosome]:
+        genes1 = FloatVectorChromosome.stack(
+            [chromosome1 for (chromosome1, _) in couples])
+        genes2 = FloatVectorChromosome.stack(
+            [chromosome2 for (_, chromosome2) in couples])
+        # A single mask draw and selection for the whole batch
+        mask = rng.random(genes1.shape) < 0.5
+        new_genes = np.where(mask, genes1, genes2)
 
-        new_chromosome.genotypes = mixed_genes
-        return new_chromosome
+        return FloatVectorChromosome.from_rows(couples[0][0].custom_data,
+                                               new_genes)
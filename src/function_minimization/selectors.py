@@ -1,50 +1,78 @@
-from copy import deepcopy
-from typing import List, Tuple, Dict
-from random import random, randint, shuffle
+from typing import List, Tuple, Dict, Optional
 from abc import ABC
-from statistics import mean
+
+import numpy as np  #type: ignore
 
 from genetic_framework.selectors import SurvivorSelector, MatingSelector, SolutionSelector
-from genetic_framework.individual import Individual
+from genetic_framework.individual import Individual, batch_fitness
+from genetic_framework.utils import k_best_indices
+from genetic_framework.rng import rng as shared_rng
 
 
 class MinimizeFitnessMatingSelector(MatingSelector, ABC):
+    """Pairs individuals by fitness rank: (best, second), (third, fourth)...
+    Populations coming from MinimizeFitnessSurvivorSelector are already
+    sorted, so the population is only sorted (inplace) when it is not."""
     @staticmethod
     def select_couples(
-            population: List[Individual], num_pairs: int,
-            maximize_fitness: bool) -> List[Tuple[Individual, Individual]]:
-        population.sort(key=lambda individual: individual.fitness(),
-                        reverse=maximize_fitness)
-        pairs: List[Tuple[Individual, Individual]] = []
-        size = len(population)
-
-        if size <= 1:
+            population: List[Individual],
+            num_pairs: int,
+            maximize_fitness: bool,
+            rng: np.random.Generator = shared_rng
+    ) -> List[Tuple[Individual, Individual]]:
+        if len(population) <= 1:
             return []
 
-        i = 0
-        for i in range(0, 2 * num_pairs, 2):
-            pairs.append((population[i], population[i + 1]))
+        fits = batch_fitness(population)
+        if maximize_fitness:
+            fits = -fits
+        if not np.all(fits[:-1] <= fits[1:]):
+            order = np.argsort(fits, kind='stable')
+            population[:] = [population[i] for i in order]
 
-        return pairs
+        return [(population[i], population[i + 1])
+                for i in range(0, 2 * num_pairs, 2)]
 
 
 class MinimizeFitnessSurvivorSelector(SurvivorSelector, ABC):
+    """Keeps the population_size best individuals among parents and breed,
+    returned sorted by fitness (best first). Parents coming from a previous
+    selection are therefore already sorted, so only the breed gets sorted
+    and both sorted runs are merged."""
     @staticmethod
-    def select_survivors(population_size: int, parents: List[Individual],
+    def select_survivors(population_size: int,
+                         parents: List[Individual],
                          breed: List[Individual],
-                         maximize_fitness: bool) -> List[Individual]:
-        new_generation_individuals = parents + breed
-        new_generation_individuals.sort(
-            key=lambda individual: individual.fitness(),
-            reverse=maximize_fitness)
-        return new_generation_individuals[:population_size]
+                         maximize_fitness: bool,
+                         rng: np.random.Generator = shared_rng
+                         ) -> List[Individual]:
+        fits = np.concatenate([batch_fitness(parents), batch_fitness(breed)])
+        if maximize_fitness:
+            fits = -fits
+
+        num_parents = len(parents)
+        parents_fits = fits[:num_parents]
+        if np.all(parents_fits[:-1] <= parents_fits[1:]):
+            parents_order = np.arange(num_parents)
+        else:
+            parents_order = np.argsort(parents_fits, kind='stable')
+        breed_order = num_parents + np.argsort(fits[num_parents:],
+                                               kind='stable')
+
+        # Stable sort (timsort) over two sorted runs is a linear merge
+        runs = np.concatenate([parents_order, breed_order])
+        merged = runs[np.argsort(fits[runs], kind='stable')]
+        return [
+            parents[i] if i < num_parents else breed[i - num_parents]
+            for i in merged[:population_size]
+        ]
 
 
 class KLowerFitnessSolutionSelector(SolutionSelector, ABC):
     def __init__(self,
                  number_solutions: int,
                  maximize_fitness: bool,
-                 custom_data: Dict = {}) -> None:
+                 custom_data: Optional[Dict] = None) -> None:
         super().__init__(number_solutions, maximize_fitness, custom_data)
         self._best_individuals: List[Individual] = []
 
@@ -57,8 +85,8 @@ class KLowerFitnessSolutionSelector(SolutionSelector, ABC):
         return self._best_individuals
 
     def update_individuals(self, population: List[Individual]) -> None:
-        self._best_individuals.extend(population)
-        self._best_individuals.sort(
-            key=lambda individual: individual.fitness(),
-            reverse=self.maximize_fitness)
-        self._best_individuals = self.best_individuals[:self.number_solutions]
+        candidates = self._best_individuals + population
+        fits = batch_fitness(candidates)
+        best = k_best_indices(fits, self.number_solutions,
+                              self.maximize_fitness)
+        self._best_individuals = [candidates[i] for i in best]
@@ -1,5 +1,6 @@
-from typing import List, Dict, Generic, TypeVar
+from typing import List, Dict, Generic, TypeVar, Hashable, Optional, Type
 from abc import ABC, abstractmethod
+from copy import copy, deepcopy
 """ TypeVariable for Generic types Chromosome, Phenotype, Genotype since each
 subclass of these will use its own data type to represent its internal data.
 """
@@ -7,21 +8,17 @@ T = TypeVar('T')
 
 
 class Phenotype(Generic[T], ABC):
-    @abstractmethod
-    def __init__(self, custom_data: Dict = {}) -> None:
-        self.custom_data = custom_data
+    """Defines an abstract class for holding information about Phenotypes.
 
-    # (https://github.com/python/mypy/issues/4165)
-    @property  # type:ignore
-    @abstractmethod
-    def data(self) -> T:
-        ...
+    data: The phenotype's data. Subclasses may keep it as a plain attribute
+    or, when values need validation, as a property with a setter.
+    """
+    __slots__ = ('custom_data', )
+    data: T
 
-    # (https://github.com/python/mypy/issues/4165)
-    @data.setter  # type:ignore
     @abstractmethod
-    def data(self, new_data: T) -> None:
-        ...
+    def __init__(self, custom_data: Optional[Dict] = None) -> None:
+        self.custom_data = custom_data if custom_data is not None else {}
 
     @abstractmethod
     def __str__(self) -> str:
@@ -33,10 +30,17 @@ class Phenotype(Generic[T], ABC):
 
 
 class Genotype(Generic[T], ABC):
-    """Defines an abstract class for holding information about Genes."""
+    """Defines an abstract class for holding information about Genes.
+
+    data: The gene's data. Subclasses may keep it as a plain attribute or,
+    when values need validation, as a property with a setter.
+    """
+    __slots__ = ('custom_data', )
+    data: T
+
     @abstractmethod
-    def __init__(self, custom_data: Dict = {}) -> None:
-        self.custom_data = custom_data
+    def __init__(self, custom_data: Optional[Dict] = None) -> None:
+        self.custom_data = custom_data if custom_data is not None else {}
 
     @abstractmethod
     def initialize(self) -> None:
@@ -44,20 +48,6 @@ class Genotype(Generic[T], ABC):
         This method doesn't return another instance, just modifies the current."""
         ...
 
-    # (https://github.com/python/mypy/issues/4165)
-    @property  # type:ignore
-    @abstractmethod
-    def data(self) -> T:
-        """Property containing the gene's data."""
-        ...
-
-    # (https://github.com/python/mypy/issues/4165)
-    @data.setter  # type:ignore
-    @abstractmethod
-    def data(self, new_data: T) -> None:
-        """Set data property (contains the gene's data)."""
-        ...
-
     @abstractmethod
     def __str__(self) -> str:
         ...
@@ -79,8 +69,8 @@ GenotypeT = TypeVar('GenotypeT', bound=Genotype)
 
 class Chromosome(Generic[PhenotypeT, GenotypeT], ABC):
     @abstractmethod
-    def __init__(self, custom_data: Dict = {}) -> None:
-        self.custom_data = custom_data
+    def __init__(self, custom_data: Optional[Dict] = None) -> None:
+        self.custom_data = custom_data if custom_data is not None else {}
 
     @staticmethod
     @abstractmethod
@@ -96,6 +86,17 @@ class Chromosome(Generic[PhenotypeT, GenotypeT], ABC):
     def initialize(self) -> None:
         ...
 
+    @classmethod
+    def initialize_batch(cls: Type, n: int, custom_data: Dict) -> List:
+        """Returns n new initialized chromosomes. Default implementation just
+        creates and initializes each one; subclasses able to draw the genes
+        of many chromosomes at once (e.g. a single (n, genes) NumPy draw)
+        should override it."""
+        chromosomes = [cls(custom_data) for _ in range(n)]
+        for chromosome in chromosomes:
+            chromosome.initialize()
+        return chromosomes
+
     # (https://github.com/python/mypy/issues/4165)
     @property  # type:ignore
     @abstractmethod
@@ -120,6 +121,38 @@ class Chromosome(Generic[PhenotypeT, GenotypeT], ABC):
     def phenotypes(self, phenotypes: List[PhenotypeT]) -> None:
         ...
 
+    def clone(self: 'ChromosomeT') -> 'ChromosomeT':
+        """Returns an independent copy of this chromosome. Default deepcopies
+        it; subclasses should override it to copy their internal data
+        directly (e.g. array copy, or clone_gene_list)."""
+        return deepcopy(self)
+
+    def clone_gene_list(self: 'ChromosomeT',
+                        attribute: str = '_genotypes') -> 'ChromosomeT':
+        """Returns a shallow copy of this chromosome whose list of genes (the
+        given attribute) holds shallow copies of its genes. Genes holding
+        immutable values (ints, floats, tuples) need nothing deeper, so
+        chromosomes keeping such genes in a list can implement clone with
+        it instead of a deepcopy."""
+        new_chromosome = copy(self)
+        setattr(new_chromosome, attribute,
+                [copy(gene) for gene in getattr(self, attribute)])
+        return new_chromosome
+
+    @staticmethod
+    def format_many(chromosomes: List) -> str:
+        """Returns the given chromosomes formatted together, one per line.
+        Default joins their str; subclasses holding array data should format
+        all of them at once instead."""
+        return '\n'.join(str(chromosome) for chromosome in chromosomes)
+
+    def content_key(self) -> Optional[Hashable]:
+        """Returns a hashable key identifying the chromosome's genes, so
+        chromosomes with equal keys are known to have equal fitness.
+        Default returns None, meaning no key is available and chromosomes
+        are never considered equal."""
+        return None
+
     @abstractmethod
     def __str__(self) -> str:
         ...
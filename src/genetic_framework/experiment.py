@@ -1,7 +1,9 @@
-from typing import Type, Tuple, TypeVar, List, Dict, Any, Optional, get_args
-from collections import defaultdict
+from typing import Type, Tuple, TypeVar, List, Dict, Any, Optional, Callable, get_args
 from operator import le, ge
+from functools import lru_cache
 from threading import Thread
+from concurrent.futures import Executor, ProcessPoolExecutor
+from multiprocessing import get_context
 
 from genetic_framework.fitness import FitnessComputer
 from genetic_framework.chromosome import Chromosome
@@ -26,7 +28,9 @@ def listen_commands(control: Dict[str, Any]) -> None:
             control['running'] = False
 
 
-# Check if cls class works with the specified chromosome type
+# Check if cls class works with the specified chromosome type. Results are
+# cached, classes don't change their bases
+@lru_cache(maxsize=None)
 def is_correct_chromosome_type(cls: Type,
                                chromosome_cls: Type[Chromosome]) -> bool:
     if not hasattr(cls, '__orig_bases__'):
@@ -48,6 +52,21 @@ def is_correct_chromosome_type(cls: Type,
     return False
 
 
+# Module level (so it can be sent to worker processes) factory of new
+# initialized individuals for the first generation
+def initialized_individuals(
+    args: Tuple[Type[Chromosome], Type[FitnessComputer], Type[Mutator],
+                Type[Recombiner], Dict, int]
+) -> List[Individual]:
+    chromosome_cls, fitness_computer_cls, mutator_cls, recombiner_cls, \
+            custom_data, n = args
+    return [
+        Individual(chromosome_cls, fitness_computer_cls, mutator_cls,
+                   recombiner_cls, 1, custom_data, chromosome)
+        for chromosome in chromosome_cls.initialize_batch(n, custom_data)
+    ]
+
+
 class Experiment:
     def __init__(self,
                  population_size: int,
@@ -69,7 +88,8 @@ class Experiment:
                  survivor_selector_cls: Type[SurvivorSelector],
                  solution_selector_cls: Type[SolutionSelector],
                  stats_collector_types: List[Type[StatisticsCollector]],
-                 custom_data: Dict = {}) -> None:
+                 custom_data: Optional[Dict] = None,
+                 fitness_workers: int = 1) -> None:
         self.population_size = population_size
         self.max_generations = max_generations
         self.crossover_prob = crossover_prob
@@ -83,24 +103,15 @@ class Experiment:
         self.chromosome_cls = chromosome_cls
 
         self.fitness_computer_cls = fitness_computer_cls
-        self.fitness_computer_cls.set_custom_data(custom_data)
         self.maximize_fitness = maximize_fitness
-
         self.mutator_cls = mutator_cls
-        self.mutator_cls.set_custom_data(custom_data)
-
         self.recombiner_cls = recombiner_cls
-        self.recombiner_cls.set_custom_data(custom_data)
-
         self.mating_selector_cls = mating_selector_cls
-        self.mating_selector_cls.set_custom_data(custom_data)
-
         self.survivor_selector_cls = survivor_selector_cls
-        self.survivor_selector_cls.set_custom_data(custom_data)
-
         self.solution_selector_cls = solution_selector_cls
         self.stats_collector_types = stats_collector_types
-        self.custom_data = custom_data
+        self.custom_data = custom_data if custom_data is not None else {}
+        self.fitness_workers = fitness_workers
 
         classes_to_be_validated = (
             (fitness_computer_cls, 'FitnessComputer'),
@@ -114,30 +125,97 @@ class Experiment:
                     '{} {} does not work with chromosome {}.'.format(
                         name, cls, chromosome_cls))
 
-    def _generate_initial_individuals(self) -> List[Individual]:
+    def set_operators_custom_data(self) -> None:
+        """Sets the experiment custom_data on every operator class. Operator
+        classes are shared by every experiment of the process, so this is
+        done when the experiment starts running (see run_experiment) rather
+        than at construction, where a later Experiment would overwrite it."""
+        for cls in (self.fitness_computer_cls, self.mutator_cls,
+                    self.recombiner_cls, self.mating_selector_cls,
+                    self.survivor_selector_cls):
+            cls.set_custom_data(self.custom_data)
+
+    def _generate_initial_individuals(
+            self, executor: Optional[Executor] = None) -> List[Individual]:
         """Internal method used to generate individuals for the first 
-        generation of the experiment"""
+        generation of the experiment, created through a single
+        initialize_batch call of the chromosome class. When executor is
+        given, they are created in chunks over it."""
+        individual_args = (self.chromosome_cls, self.fitness_computer_cls,
+                           self.mutator_cls, self.recombiner_cls,
+                           self.custom_data)
+        if executor is None:
+            return initialized_individuals(
+                (*individual_args, self.population_size))
+
+        num_chunks = min(self.population_size, 4 * self.fitness_workers)
+        chunk_sizes = [
+            (self.population_size + i) // num_chunks
+            for i in range(num_chunks)
+        ]
         return [
-            Individual(self.chromosome_cls, self.fitness_computer_cls,
-                       self.mutator_cls, self.recombiner_cls, 1,
-                       self.custom_data).initialize()
-            for i in range(self.population_size)
+            individual for chunk in executor.map(
+                initialized_individuals,
+                [(*individual_args, size) for size in chunk_sizes])
+            for individual in chunk
         ]
 
     def run_experiment(
-            self) -> Tuple[List[Individual], List[StatisticsCollector]]:
-        control = {'running': True}
-        commands_thread = Thread(target=listen_commands,
-                                 daemon=True,
-                                 args=(control, ))
-        commands_thread.start()
+        self,
+        migrate: Optional[Callable[[Population], None]] = None,
+        interactive: bool = True
+    ) -> Tuple[List[Individual], List[StatisticsCollector]]:
+        """Evolves the population until a stop condition is met, returning
+        the best individuals found and the statistics collected.
+
+        migrate: When given, called with the population after every
+        generation is evolved (e.g. to exchange individuals with islands).
+        interactive: Whether to listen stdin for stop commands.
+        """
+        self.set_operators_custom_data()
 
-        initial_individuals = self._generate_initial_individuals()
+        control = {'running': True}
+        if interactive:
+            commands_thread = Thread(target=listen_commands,
+                                     daemon=True,
+                                     args=(control, ))
+            commands_thread.start()
+
+        # Workers are spawned, not forked: a forked child closing stdin would
+        # deadlock on the lock held by listen_commands. Spawned processes
+        # don't carry class attributes, so custom_data is set by initializer.
+        fitness_executor: Optional[Executor] = None
+        if self.fitness_workers > 1:
+            fitness_executor = ProcessPoolExecutor(
+                self.fitness_workers,
+                mp_context=get_context('spawn'),
+                initializer=self.fitness_computer_cls.set_custom_data,
+                initargs=(self.custom_data, ))
+
+        # Workers are shut down however the run ends (even on an exception
+        # or Ctrl-C), so no spawned process is left running
+        try:
+            return self._evolve(control, fitness_executor, migrate)
+        finally:
+            if fitness_executor is not None:
+                fitness_executor.shutdown()
+
+    def _evolve(
+        self, control: Dict[str, Any], fitness_executor: Optional[Executor],
+        migrate: Optional[Callable[[Population], None]]
+    ) -> Tuple[List[Individual], List[StatisticsCollector]]:
+        """Internal method running the generations of run_experiment, while
+        control['running'] holds and no stop condition is met."""
+        # Only fitness computations of this run count towards its budget
+        initial_fitness_computed = Individual.total_fitness_computed
+        initial_individuals = self._generate_initial_individuals(
+            fitness_executor)
         population = Population(initial_individuals, self.crossover_prob,
                                 self.mutation_prob, self.breed_size,
                                 self.num_parent_pairs, self.maximize_fitness,
                                 self.mating_selector_cls,
-                                self.survivor_selector_cls)
+                                self.survivor_selector_cls, fitness_executor,
+                                self.fitness_workers)
         solution_selector = self.solution_selector_cls(self.num_solutions,
                                                        self.maximize_fitness,
                                                        self.custom_data)
@@ -146,11 +224,11 @@ class Experiment:
             for collector_type in self.stats_collector_types
         ]
 
-        # Counts how many times fitness was called for each individual id
-        individual_num_fitness_computed: Dict[int, int] = defaultdict(int)
-        current_num_fitness_computations = 0
+        current_num_fitness_computations = \
+                Individual.total_fitness_computed - initial_fitness_computed
         # Count how many times sd was 0 in a row
         zero_sd_counter = 0
+        fitness_comparator = ge if self.maximize_fitness else le
 
         while population.generation <= self.max_generations and control[
                 'running']:
@@ -162,17 +240,14 @@ class Experiment:
                         population.avg_fitness(), population.sd_fitness()))
 
             population.evolve()
+            if migrate is not None:
+                migrate(population)
             solution_selector.update_individuals(population.population)
             for collector in statistics_collectors:
                 collector.collect_data_point(population, solution_selector)
 
-            for individual in population.population:
-                if individual.num_fitness_computed != individual_num_fitness_computed[
-                        id(individual)]:
-                    individual_num_fitness_computed[id(
-                        individual)] = individual.num_fitness_computed
-            current_num_fitness_computations = sum(
-                individual_num_fitness_computed.values())
+            current_num_fitness_computations = \
+                    Individual.total_fitness_computed - initial_fitness_computed
 
             if current_num_fitness_computations >= self.max_fitness_computations:
                 print(
@@ -180,14 +255,14 @@ class Experiment:
                         current_num_fitness_computations))
                 break
 
-            fitness_comparator = ge if self.maximize_fitness else le
             if self.target_fitness is not None and fitness_comparator(
                     solution_selector.best_individual.fitness(),
                     self.target_fitness):
                 print("Target fitness achieved ({}).".format(
                     solution_selector.best_individual.fitness()))
                 break
-            if float_equal(population.sd_fitness(), 0.0):
+            # Standard deviation is never negative
+            if population.sd_fitness() < EPS:
                 zero_sd_counter += 1
             else:
                 zero_sd_counter = 0
@@ -201,7 +276,3 @@ class Experiment:
                 .format(population.avg_fitness(), population.sd_fitness()))
 
         return (solution_selector.best_individuals, statistics_collectors)
-
-
-def float_equal(f1: float, f2: float) -> bool:
-    return abs(f1 - f2) < EPS
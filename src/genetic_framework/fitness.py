@@ -1,10 +1,18 @@
-from typing import Generic, Type
+from typing import Generic, Type, List, Dict
 from abc import ABC, abstractmethod
+from itertools import count
+
+import numpy as np  #type: ignore
 
 from genetic_framework.chromosome import ChromosomeT
 from genetic_framework.custom_data import CustomDataHolder
 
 
+# Shared by every FitnessComputer, so no two custom_data settings get the same
+# version
+_custom_data_versions = count(1)
+
+
 class FitnessComputer(Generic[ChromosomeT], CustomDataHolder, ABC):
     """Defines an abstract class for for types that knows how to compute the 
     fitness for a given type of Chromosome. Subclasses should specify
@@ -13,12 +21,39 @@ class FitnessComputer(Generic[ChromosomeT], CustomDataHolder, ABC):
     class SubClassFitnessComputer(FitnessComputer[SubClassChromosome])...
 
     Then, fitness method can receive SubClassChromosome safely typechecked.
+
+    custom_data_version changes every time custom_data is set, so fitness
+    values cached under a previous custom_data are not reused.
     """
+    custom_data_version = 0
+
+    @classmethod
+    def set_custom_data(cls, custom_data: Dict) -> None:
+        super().set_custom_data(custom_data)
+        cls.custom_data_version = next(_custom_data_versions)
+
     @classmethod
     @abstractmethod
     def fitness(cls: Type, chromosome: ChromosomeT) -> float:
         """Computes fitness for a given Chromosome. Subclasses should specify
         the correct type of Chromosome as parameter. 
         (Accordingly to the ChromosomeType specified at the class declaration)
+        Heavy numeric work is best written in a module level function
+        decorated with genetic_framework.jit and called from here.
         """
         ...
+
+    @classmethod
+    def fitness_batch(cls: Type, chromosomes: List[ChromosomeT]) -> np.ndarray:
+        """Computes fitness for a list of Chromosomes, returning them as a
+        float64 array in the same order. Default implementation just calls
+        fitness for each one; subclasses able to evaluate many chromosomes
+        at once should override it, e.g. stacking genes into a
+        (len(chromosomes), genes) array and running a NumPy expression over
+        it, or a @jit(parallel=True) function looping with prange over
+        the rows (see function_minimization.kernels).
+        """
+        return np.fromiter((cls.fitness(chromosome)
+                            for chromosome in chromosomes),
+                           dtype=np.float64,
+                           count=len(chromosomes))
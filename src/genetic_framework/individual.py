@@ -1,10 +1,51 @@
-from typing import Generic, Dict, Type
-from functools import lru_cache
+from typing import Generic, Dict, Type, List, Optional, Hashable, Tuple
+from collections import OrderedDict
+from concurrent.futures import Executor
+from math import ceil
+from os import environ
+
+import numpy as np  #type: ignore
 
 from genetic_framework.chromosome import ChromosomeT
 from genetic_framework.fitness import FitnessComputer
 from genetic_framework.mutator import Mutator
 from genetic_framework.recombiner import Recombiner
+from genetic_framework.rng import rng as shared_rng
+
+# Maximum number of chromosome fitnesses kept by the shared fitness cache,
+# can be changed through GENETIC_FRAMEWORK_FITCACHE_SIZE (large populations
+# with many repeated genomes may benefit from a larger one)
+FITNESS_CACHE_SIZE = int(environ.get('GENETIC_FRAMEWORK_FITCACHE_SIZE', 4096))
+
+# Setting GENETIC_FRAMEWORK_DISABLE_FITCACHE turns off the shared fitness
+# cache and content_key deduplication, for problems whose fitness is cheaper
+# to compute than a chromosome's content_key (lookups would only slow it down)
+FITNESS_CACHE_ENABLED = not environ.get('GENETIC_FRAMEWORK_DISABLE_FITCACHE')
+
+# Shared LRU cache of fitness values keyed by (FitnessComputer class, its
+# custom_data_version, chromosome content_key), so genetically identical
+# individuals (even from different generations) don't have their fitness
+# recomputed. Values computed under another custom_data are never hit.
+FitnessCacheKey = Tuple[Type[FitnessComputer], int, Hashable]
+_fitness_cache: 'OrderedDict[FitnessCacheKey, float]' = OrderedDict()
+
+
+def _cached_fitness(fitness_computer_cls: Type[FitnessComputer],
+                    key: Hashable) -> Optional[float]:
+    cache_key = (fitness_computer_cls,
+                 fitness_computer_cls.custom_data_version, key)
+    fitness = _fitness_cache.get(cache_key)
+    if fitness is not None:
+        _fitness_cache.move_to_end(cache_key)
+    return fitness
+
+
+def _cache_fitness(fitness_computer_cls: Type[FitnessComputer],
+                   key: Hashable, fitness: float) -> None:
+    _fitness_cache[(fitness_computer_cls,
+                    fitness_computer_cls.custom_data_version, key)] = fitness
+    if len(_fitness_cache) > FITNESS_CACHE_SIZE:
+        _fitness_cache.popitem(last=False)
 
 
 class Individual(Generic[ChromosomeT]):
@@ -14,27 +55,43 @@ class Individual(Generic[ChromosomeT]):
     fitness_computer_cls: Class for computing fitness.
     mutator_cls: Class for mutating the individual.
     recombiner_cls: Class for recombining individual with another one.
+    custom_data: Passed to the new chromosome when chromosome is not given
+    (not kept by the individual, its chromosome holds it).
+    chromosome: Already built chromosome to use. When not given, a new one is
+    created from chromosome_cls.
     """
+    __slots__ = ('chromosome_cls', 'fitness_computer_cls', 'mutator_cls',
+                 'recombiner_cls', 'generation', 'num_fitness_computed',
+                 '_fitness', '_chromosome')
+
+    # Fitness computations done by all individuals of this process, so the
+    # total doesn't need to be summed over populations. Fitness values taken
+    # from the shared fitness cache were not computed, so they don't count
+    # (nor towards an experiment's max_fitness_computations budget)
+    total_fitness_computed = 0
+
     def __init__(self,
                  chromosome_cls: Type[ChromosomeT],
                  fitness_computer_cls: Type[FitnessComputer],
                  mutator_cls: Type[Mutator],
                  recombiner_cls: Type[Recombiner],
                  generation: int = 1,
-                 custom_data: Dict = {}) -> None:
+                 custom_data: Optional[Dict] = None,
+                 chromosome: Optional[ChromosomeT] = None) -> None:
         self.chromosome_cls = chromosome_cls
         self.fitness_computer_cls = fitness_computer_cls
         self.mutator_cls = mutator_cls
         self.recombiner_cls = recombiner_cls
         self.generation = generation
-        self.custom_data = custom_data
 
         self.num_fitness_computed = 0
-        self._chromosome = self.chromosome_cls(custom_data)
+        self._fitness: Optional[float] = None
+        self._chromosome = chromosome if chromosome is not None \
+                else self.chromosome_cls(custom_data)
 
     def initialize(self) -> 'Individual':
         self.chromosome.initialize()
-        self.fitness.cache_clear()
+        self._fitness = None
         return self
 
     @property
@@ -43,19 +100,32 @@ class Individual(Generic[ChromosomeT]):
 
     @chromosome.setter
     def chromosome(self, new_chromosome: ChromosomeT) -> None:
-        self.fitness.cache_clear()
+        self._fitness = None
         self._chromosome = new_chromosome
 
     # Caches fitness computation to avoid wasting CPU time
-    @lru_cache
     def fitness(self) -> float:
-        self.num_fitness_computed += 1
-        return self.fitness_computer_cls.fitness(self.chromosome)
+        if self._fitness is None:
+            key = self.chromosome.content_key() \
+                    if FITNESS_CACHE_ENABLED else None
+            if key is not None:
+                self._fitness = _cached_fitness(self.fitness_computer_cls,
+                                                key)
+
+            if self._fitness is None:
+                self.num_fitness_computed += 1
+                Individual.total_fitness_computed += 1
+                self._fitness = self.fitness_computer_cls.fitness(
+                    self.chromosome)
+                if key is not None:
+                    _cache_fitness(self.fitness_computer_cls, key,
+                                   self._fitness)
+        return self._fitness
 
     def self_mutate(self) -> 'Individual':
         """Use mutator to change this individual chromosome and return itself"""
         self.mutator_cls.mutate_inplace(self.chromosome)
-        self.fitness.cache_clear()
+        self._fitness = None
         return self
 
     def recombine(self, other: 'Individual') -> 'Individual':
@@ -66,17 +136,30 @@ class Individual(Generic[ChromosomeT]):
 
         return self.new_individual(new_chromosome, self.generation + 1)
 
+    def clone(self) -> 'Individual':
+        """Returns a copy of this individual holding a clone of its
+        chromosome. Cached fitness is kept since the genes are the same."""
+        new_individual = self.new_individual(self.chromosome.clone(),
+                                             self.generation)
+        new_individual._fitness = self._fitness
+        return new_individual
+
     def new_individual(self,
                        chromosome: ChromosomeT,
                        generation: int = 1) -> 'Individual':
         """Returns a new individual with the given gene using the same fitness
         computer, genemutator, recombiner of this individual"""
-        new_individual = Individual(self.chromosome_cls,
-                                    self.fitness_computer_cls,
-                                    self.mutator_cls, self.recombiner_cls,
-                                    generation, self.custom_data)
-        new_individual.chromosome = chromosome
-
+        # Fills the slots directly instead of going through __init__, since
+        # every argument is already known to be valid
+        new_individual: Individual = Individual.__new__(Individual)
+        new_individual.chromosome_cls = self.chromosome_cls
+        new_individual.fitness_computer_cls = self.fitness_computer_cls
+        new_individual.mutator_cls = self.mutator_cls
+        new_individual.recombiner_cls = self.recombiner_cls
+        new_individual.generation = generation
+        new_individual.num_fitness_computed = 0
+        new_individual._fitness = None
+        new_individual._chromosome = chromosome
         return new_individual
 
     def __str__(self) -> str:
@@ -84,3 +167,104 @@ class Individual(Generic[ChromosomeT]):
 
     def __repr__(self) -> str:
         return self.__str__()
+
+
+def batch_fitness(individuals: List[Individual],
+                  executor: Optional[Executor] = None,
+                  num_chunks: int = 1) -> np.ndarray:
+    """Returns the fitness of every individual as a float64 array. Individuals
+    without a cached fitness are evaluated together through a single
+    fitness_batch call of their FitnessComputer (all individuals are expected
+    to share the same one) and the results are cached back on them.
+    Individuals whose chromosomes share the same content_key are evaluated
+    only once, and not at all when found in the shared fitness cache
+    (unless disabled, see FITNESS_CACHE_ENABLED).
+
+    executor: When given, evaluation is split into num_chunks fitness_batch
+    calls mapped over it (e.g. a ProcessPoolExecutor with num_chunks workers).
+    """
+    # Individuals to evaluate grouped by content_key, and the ones without a
+    # key (each evaluated on its own and never cached)
+    pending: Dict[Hashable, List[Individual]] = {}
+    keyless: List[Individual] = []
+    for individual in individuals:
+        if individual._fitness is not None:
+            continue
+
+        key = individual.chromosome.content_key() \
+                if FITNESS_CACHE_ENABLED else None
+        if key is None:
+            keyless.append(individual)
+            continue
+
+        individual._fitness = _cached_fitness(
+            individual.fitness_computer_cls, key)
+        if individual._fitness is None:
+            pending.setdefault(key, []).append(individual)
+
+    if len(pending) > 0 or len(keyless) > 0:
+        keys = list(pending.keys())
+        groups = list(pending.values()) + \
+                [[individual] for individual in keyless]
+        fitness_computer_cls = groups[0][0].fitness_computer_cls
+        chromosomes = [group[0].chromosome for group in groups]
+        if executor is None or num_chunks <= 1:
+            fits = fitness_computer_cls.fitness_batch(chromosomes)
+        else:
+            chunk_size = ceil(len(chromosomes) / num_chunks)
+            chunks = [
+                chromosomes[i:i + chunk_size]
+                for i in range(0, len(chromosomes), chunk_size)
+            ]
+            fits = np.concatenate(
+                list(executor.map(fitness_computer_cls.fitness_batch,
+                                  chunks)))
+
+        Individual.total_fitness_computed += len(groups)
+        for i, (group, fit) in enumerate(zip(groups, fits)):
+            group[0].num_fitness_computed += 1
+            for individual in group:
+                individual._fitness = float(fit)
+            # Keyed groups come first
+            if i < len(keys):
+                _cache_fitness(fitness_computer_cls, keys[i], float(fit))
+
+    return np.fromiter((individual.fitness() for individual in individuals),
+                       dtype=np.float64,
+                       count=len(individuals))
+
+
+def batch_recombine(
+        couples: List[Tuple[Individual, Individual]],
+        rng: np.random.Generator = shared_rng) -> List[Individual]:
+    """Recombines every couple of individuals through a single recombine_batch
+    call of their Recombiner (all individuals are expected to share the same
+    one) drawing from rng, returning the new individuals in the same
+    order."""
+    if len(couples) == 0:
+        return []
+
+    recombiner_cls = couples[0][0].recombiner_cls
+    new_chromosomes = recombiner_cls.recombine_batch([
+        (individual1.chromosome, individual2.chromosome)
+        for (individual1, individual2) in couples
+    ], rng)
+    return [
+        individual1.new_individual(chromosome, individual1.generation + 1)
+        for ((individual1, _), chromosome) in zip(couples, new_chromosomes)
+    ]
+
+
+def batch_mutate(individuals: List[Individual],
+                 rng: np.random.Generator = shared_rng) -> None:
+    """Mutates every individual inplace through a single mutate_batch_inplace
+    call of their Mutator (all individuals are expected to share the same
+    one) drawing from rng."""
+    if len(individuals) == 0:
+        return
+
+    mutator_cls = individuals[0].mutator_cls
+    mutator_cls.mutate_batch_inplace(
+        [individual.chromosome for individual in individuals], rng)
+    for individual in individuals:
+        individual._fitness = None
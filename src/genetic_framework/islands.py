@@ -0,0 +1,109 @@
+from typing import List, Tuple, Any
+from copy import copy
+from random import randrange
+from queue import Empty
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+
+from genetic_framework.experiment import Experiment
+from genetic_framework.individual import Individual
+from genetic_framework.population import Population
+from genetic_framework.statistics import StatisticsCollector
+
+
+# Module level (so it can be sent to worker processes) runner of one island
+def run_island(
+    experiment: Experiment, island: int, queues: List[Any],
+    migration_interval: int, migration_size: int, ring: bool
+) -> Tuple[List[Individual], List[StatisticsCollector]]:
+    def migrate(population: Population) -> None:
+        if population.generation % migration_interval != 0:
+            return
+
+        # Best individuals go to the next island on the ring, or to a random
+        # other island (rumor spreading)
+        if ring:
+            neighbor = (island + 1) % len(queues)
+        else:
+            neighbor = randrange(len(queues) - 1)
+            if neighbor >= island:
+                neighbor += 1
+        queues[neighbor].put(population.best_individuals(migration_size))
+
+        # Don't wait for migrants, just take the ones that already arrived
+        while True:
+            try:
+                migrants: List[Individual] = queues[island].get_nowait()
+            except Empty:
+                return
+            population.migrate(migrants)
+
+    return experiment.run_experiment(migrate, interactive=False)
+
+
+class IslandExperiment:
+    """Island model of an Experiment: num_islands copies of it run in
+    parallel processes, each evolving its own population. Every
+    migration_interval generations an island sends its migration_size best
+    individuals to another random island (or to the next one, when ring is
+    set), where they replace the worst ones. Migration is asynchronous:
+    islands never wait for each other.
+
+    The experiment population_size, max_fitness_computations and
+    num_parent_pairs are split evenly among islands. Other stop conditions
+    apply to each island separately. After running, island_statistics holds
+    the statistics collected by every island.
+    """
+    def __init__(self,
+                 experiment: Experiment,
+                 num_islands: int,
+                 migration_interval: int = 10,
+                 migration_size: int = 1,
+                 ring: bool = False) -> None:
+        if num_islands < 2:
+            raise ValueError(
+                'IslandExperiment needs at least 2 islands ({} given).'.format(
+                    num_islands))
+
+        self.experiment = experiment
+        self.num_islands = num_islands
+        self.island_experiment = copy(experiment)
+        self.island_experiment.population_size = max(
+            2, experiment.population_size // num_islands)
+        self.island_experiment.max_fitness_computations = max(
+            1, experiment.max_fitness_computations // num_islands)
+        # Fewer parents per island too, or an island population could be
+        # too small to provide them
+        self.island_experiment.num_parent_pairs = max(
+            1, experiment.num_parent_pairs // num_islands)
+        self.migration_interval = migration_interval
+        self.migration_size = migration_size
+        self.ring = ring
+        self.island_statistics: List[List[StatisticsCollector]] = []
+
+    def run_experiment(
+            self) -> Tuple[List[Individual], List[StatisticsCollector]]:
+        """Runs every island until it stops, returning the best individuals
+        among all islands and the statistics collected by the first one."""
+        context = get_context('spawn')
+        with context.Manager() as manager, ProcessPoolExecutor(
+                self.num_islands, mp_context=context) as executor:
+            queues = [manager.Queue() for _ in range(self.num_islands)]
+            futures = [
+                executor.submit(run_island, self.island_experiment, island,
+                                queues, self.migration_interval,
+                                self.migration_size, self.ring)
+                for island in range(self.num_islands)
+            ]
+            results = [future.result() for future in futures]
+
+        solution_selector = self.experiment.solution_selector_cls(
+            self.experiment.num_solutions, self.experiment.maximize_fitness,
+            self.experiment.custom_data)
+        for (best_individuals, _) in results:
+            solution_selector.update_individuals(best_individuals)
+        self.island_statistics = [
+            statistics_collectors for (_, statistics_collectors) in results
+        ]
+
+        return (solution_selector.best_individuals, results[0][1])
@@ -0,0 +1,33 @@
+"""Optional numba compilation for operator kernels.
+
+jit compiles a function with numba.njit(cache=True, fastmath=True) when numba
+is installed and returns it untouched otherwise. It can be used bare (@jit) or
+with extra numba options (@jit(parallel=True)). Decorated functions should
+live at module level, so cache=True can reuse their compiled code across runs
+and they can be pickled to worker processes.
+
+Kernels written as NumPy array expressions run as regular NumPy code without
+numba, and parallel=True lets numba fuse them and spread them over cores.
+"""
+from typing import Any, Callable, TypeVar
+
+F = TypeVar('F', bound=Callable)
+
+try:
+    from numba import njit  #type: ignore
+except ImportError:
+    # numba is optional, fallback to plain Python/NumPy execution
+    njit = None
+
+DEFAULT_OPTIONS = {'cache': True, 'fastmath': True}
+
+
+def jit(fn: Any = None, **options: Any) -> Any:
+    def decorator(fn: F) -> F:
+        if njit is None:
+            return fn
+        return njit(**{**DEFAULT_OPTIONS, **options})(fn)  #type: ignore
+
+    if fn is not None:
+        return decorator(fn)
+    return decorator
@@ -1,10 +1,12 @@
-from typing import Generic, Type
+from typing import Generic, Type, List
 from abc import ABC, abstractmethod
-from copy import deepcopy
-from random import randint
+from random import randint, sample
+
+import numpy as np  #type: ignore
 
 from genetic_framework.chromosome import ChromosomeT, Chromosome
 from genetic_framework.custom_data import CustomDataHolder
+from genetic_framework.rng import rng as shared_rng
 
 
 class Mutator(Generic[ChromosomeT], CustomDataHolder, ABC):
@@ -23,7 +25,7 @@ class Mutator(Generic[ChromosomeT], CustomDataHolder, ABC):
         the correct type of Chromosome as parameter. 
         (Accordingly to the ChromosomeType specified at the class declaration)
         """
-        new_chromosome = deepcopy(chromosome)
+        new_chromosome = chromosome.clone()
         cls.mutate_inplace(new_chromosome)
         return new_chromosome
 
@@ -33,38 +35,96 @@ class Mutator(Generic[ChromosomeT], CustomDataHolder, ABC):
         """Mutate a given chromosome (modifying it, not returning a new one). 
         Subclasses should specify the correct type of Chromosome as parameter. 
         (Accordingly to the ChromosomeType specified at the class declaration)
+        When the chromosome exposes its internal genes (e.g. a list or array
+        returned by genotypes/data) they can be modified directly, without
+        assigning them back, e.g. by a module level genetic_framework.jit
+        function.
         """
         ...
 
+    @classmethod
+    def mutate_batch_inplace(
+            cls: Type,
+            chromosomes: List[ChromosomeT],
+            rng: np.random.Generator = shared_rng) -> None:
+        """Mutate every given chromosome inplace. Default implementation just
+        calls mutate_inplace for each one; subclasses able to mutate many
+        chromosomes at once should override it, drawing their random values
+        from rng (the calling Population's generator).
+        """
+        for chromosome in chromosomes:
+            cls.mutate_inplace(chromosome)
+
 
 class SwapGeneMutator(Mutator[Chromosome], ABC):
     @classmethod
     def mutate_inplace(cls: Type, chromosome: Chromosome) -> None:
-        number_genes = len(chromosome.genotypes)
-
-        r1 = randint(0, number_genes - 1)
-        r2 = randint(0, number_genes - 1)
-        while r1 == r2:
-            r2 = randint(0, number_genes - 1)
-
         genes = chromosome.genotypes
+        if len(genes) < 2:
+            # Nothing to swap
+            return
+
+        # Two distinct positions drawn at once
+        r1, r2 = sample(range(len(genes)), 2)
 
         # Swap genes
         genes[r1], genes[r2] = genes[r2], genes[r1]
         chromosome.genotypes = genes  # type: ignore
 
+    @classmethod
+    def mutate_batch_inplace(
+            cls: Type,
+            chromosomes: List[Chromosome],
+            rng: np.random.Generator = shared_rng) -> None:
+        # Chromosomes with less than 2 genes have nothing to swap
+        swappable = [(chromosome, chromosome.genotypes)
+                     for chromosome in chromosomes]
+        swappable = [(chromosome, genes) for (chromosome, genes) in swappable
+                     if len(genes) >= 2]
+        if len(swappable) == 0:
+            return
+        chromosomes = [chromosome for (chromosome, _) in swappable]
+        genes_list = [genes for (_, genes) in swappable]
+        sizes = np.array([len(genes) for genes in genes_list])
+
+        # Second position is offset from the first, so they are distinct
+        r1 = (rng.random(len(sizes)) * sizes).astype(int)
+        r2 = (r1 + 1 +
+              (rng.random(len(sizes)) * (sizes - 1)).astype(int)) % sizes
+
+        for (chromosome, genes, i, j) in zip(chromosomes, genes_list,
+                                             r1.tolist(), r2.tolist()):
+            genes[i], genes[j] = genes[j], genes[i]
+            chromosome.genotypes = genes  # type: ignore
+
 
 class SwapGeneRangeMutator(Mutator[Chromosome], ABC):
     @classmethod
     def mutate_inplace(cls: Type, chromosome: Chromosome) -> None:
-        number_genes = len(chromosome.genotypes)
+        genes = chromosome.genotypes
+        number_genes = len(genes)
 
         l = randint(0, number_genes - 1)
         r = randint(l, number_genes - 1)
 
-        genes = chromosome.genotypes
-        _range = genes[l:r + 1]
-        _range.reverse()
+        # Reverse the range inplace instead of concatenating three lists
+        genes[l:r + 1] = genes[l:r + 1][::-1]
+        chromosome.genotypes = genes  # type: ignore
 
-        chromosome.genotypes = genes[:l] + _range + genes[r +  # type: ignore
-                                                          1:]
+    @classmethod
+    def mutate_batch_inplace(
+            cls: Type,
+            chromosomes: List[Chromosome],
+            rng: np.random.Generator = shared_rng) -> None:
+        genes_list = [chromosome.genotypes for chromosome in chromosomes]
+        sizes = np.array([len(genes) for genes in genes_list])
+
+        # Same distribution as mutate_inplace: l uniform, then r uniform in
+        # [l, size - 1]
+        ls = (rng.random(len(sizes)) * sizes).astype(int)
+        rs = ls + (rng.random(len(sizes)) * (sizes - ls)).astype(int)
+
+        for (chromosome, genes, l, r) in zip(chromosomes, genes_list,
+                                             ls.tolist(), rs.tolist()):
+            genes[l:r + 1] = genes[l:r + 1][::-1]
+            chromosome.genotypes = genes  # type: ignore
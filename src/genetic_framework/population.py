@@ -1,34 +1,32 @@
-from typing import List, Type, Callable, TypeVar
-from functools import lru_cache
-from copy import deepcopy
-from random import random, randint
-from math import sqrt
-from statistics import mean, stdev
-
-from genetic_framework.individual import Individual
-from genetic_framework.selectors import SurvivorSelector, MatingSelector
-
-T = TypeVar('T')
-
-
-def clear_caches_after(fn: Callable[..., T]) -> Callable[..., T]:
-    # Decorator for clearing Population cache after given method execution
-    def wrapper(self, *args):
-        res = fn(self, *args)
-        self.avg_fitness.cache_clear()
-        self.sd_fitness.cache_clear()
+from typing import List, Type, Optional
+from concurrent.futures import Executor
 
-        return res
+import numpy as np  #type: ignore
 
-    return wrapper
+from genetic_framework.individual import Individual, batch_fitness, batch_recombine, batch_mutate
+from genetic_framework.selectors import SurvivorSelector, MatingSelector
+from genetic_framework.rng import rng as shared_rng
 
 
 class Population:
+    """Evolving set of individuals. Besides the population list, fitnesses
+    holds their fitness as a float64 array in the same order, refreshed
+    every time the population changes.
+
+    rng: NumPy Generator drawing the per generation crossover, clone and
+    mutation decisions, and passed to the selectors and batch operators for
+    their own draws (the shared genetic_framework.rng one when not given).
+    Scalar operator methods (mutate_inplace, recombine) still draw from
+    the shared generators.
+    """
     def __init__(self, population: List[Individual], crossover_prob: float,
                  mutation_prob: float, breed_size: int, num_parent_pairs: int,
                  maximize_fitness: bool,
                  mating_selector_cls: Type[MatingSelector],
-                 survivor_selector_cls: Type[SurvivorSelector]) -> None:
+                 survivor_selector_cls: Type[SurvivorSelector],
+                 fitness_executor: Optional[Executor] = None,
+                 fitness_chunks: int = 1,
+                 rng: Optional[np.random.Generator] = None) -> None:
         self.population = population
         self.crossover_prob = crossover_prob
         self.mutation_prob = mutation_prob
@@ -37,7 +35,22 @@ class Population:
         self.maximize_fitness = maximize_fitness
         self.mating_selector_cls = mating_selector_cls
         self.survivor_selector_cls = survivor_selector_cls
+        self.fitness_executor = fitness_executor
+        self.fitness_chunks = fitness_chunks
+        self.rng = rng if rng is not None else shared_rng
         self.generation = 1
+        self._update_fitnesses()
+
+    def _update_fitnesses(self) -> None:
+        """Internal method used to refresh the fitnesses array (fitness of
+        population[i] at index i), its sum and standard deviation (kept so
+        avg_fitness and sd_fitness are O(1)) after individuals are replaced."""
+        self.fitnesses: np.ndarray = batch_fitness(self.population,
+                                                   self.fitness_executor,
+                                                   self.fitness_chunks)
+        self._fitness_sum = float(np.sum(self.fitnesses))
+        self._fitness_sd = float(np.std(self.fitnesses, ddof=1)) \
+                if len(self.fitnesses) > 1 else 0.0
 
     def _offspring(self) -> List[Individual]:
         """Internal method used to create a list of new individuals (breed)
@@ -48,9 +61,9 @@ class Population:
         # if population has a single individual return a copies of it (may suffer mutation)
         if len(self.population) == 1:
             for _ in range(self.num_parent_pairs * self.breed_size):
-                new_individual = deepcopy(self.population[0])
+                new_individual = self.population[0].clone()
 
-                mutation_r = random()
+                mutation_r = self.rng.random()
                 if mutation_r < self.mutation_prob:
                     new_individual.self_mutate()
 
@@ -60,51 +73,85 @@ class Population:
             return breed
 
         parents = self.mating_selector_cls.select_couples(
-            self.population, self.num_parent_pairs, self.maximize_fitness)
-
-        for (p1, p2) in parents:
-            for _ in range(self.breed_size):
-                # Generate child maybe cloned from parents
-                crossover_r = random()
-                if crossover_r < self.crossover_prob:
-                    breed.append(p1.recombine(p2))
-                else:
-                    chosen_parent_clone = p1 if randint(0, 1) == 0 else p2
-                    chosen_parent_clone = deepcopy(chosen_parent_clone)
-                    breed.append(chosen_parent_clone)
-
-                breed[-1].generation = self.generation
-
-                # Maybe mutate generated child
-                mutation_r = random()
-                if mutation_r < self.mutation_prob:
-                    breed[-1].self_mutate()
+            self.population, self.num_parent_pairs, self.maximize_fitness,
+            self.rng)
+
+        # Decide every child first so recombination and mutation of the
+        # whole breed go through a single batch call each. Random draws for
+        # the whole generation are taken at once. Child k comes from the
+        # couple k // breed_size.
+        couple_indexes = np.repeat(np.arange(len(parents)), self.breed_size)
+        crossover_draws = self.rng.random(
+            len(couple_indexes)) < self.crossover_prob
+        clone_draws = self.rng.integers(0, 2, len(couple_indexes))
+
+        # Children not generated by crossover are clones of a parent
+        breed = [
+            parents[i][parent].clone() for (i, parent) in zip(
+                couple_indexes[~crossover_draws], clone_draws[~crossover_draws])
+        ]
+        couples = [parents[i] for i in couple_indexes[crossover_draws]]
+
+        breed.extend(batch_recombine(couples, self.rng))
+
+        # Maybe mutate generated children
+        mutation_draws = self.rng.random(len(breed)) < self.mutation_prob
+        batch_mutate([
+            child for (child, mutate) in zip(breed, mutation_draws) if mutate
+        ], self.rng)
+
+        for child in breed:
+            child.generation = self.generation
 
         return breed
 
-    @clear_caches_after
     def evolve(self) -> None:
         """Method used to evolve the population into the next generation"""
+        # Current population is already evaluated (see _update_fitnesses).
+        # Evaluate the breed up front so selectors only read cached values
+        # (this is where evaluation can go parallel)
         breed = self._offspring()
+        batch_fitness(breed, self.fitness_executor, self.fitness_chunks)
         survivors = self.survivor_selector_cls.select_survivors(
             len(self.population), self.population, breed,
-            self.maximize_fitness)
+            self.maximize_fitness, self.rng)
         self.population = survivors
         self.generation += 1
+        self._update_fitnesses()
 
-    @clear_caches_after
     def restart_population(self) -> None:
         for individual in self.population:
             individual.initialize()
+        self._update_fitnesses()
+
+    def best_individuals(self, k: int) -> List[Individual]:
+        """Returns the k best individuals of the population, best first."""
+        order = np.argsort(self.fitnesses, kind='stable')
+        if self.maximize_fitness:
+            order = order[::-1]
+        return [self.population[i] for i in order[:k]]
+
+    def migrate(self, migrants: List[Individual]) -> None:
+        """Replaces the worst individuals of the population with migrants
+        (individuals coming from another population)."""
+        order = np.argsort(self.fitnesses, kind='stable')
+        if not self.maximize_fitness:
+            order = order[::-1]
+        for (i, migrant) in zip(order, migrants):
+            self.population[i] = migrant
+        self._update_fitnesses()
+
+    def __str__(self) -> str:
+        if len(self.population) == 0:
+            return ''
+
+        chromosome_cls = self.population[0].chromosome_cls
+        formatted: str = chromosome_cls.format_many(
+            [individual.chromosome for individual in self.population])
+        return formatted
 
-    @lru_cache
     def avg_fitness(self) -> float:
-        return mean([individual.fitness() for individual in self.population])
+        return self._fitness_sum / len(self.population)
 
-    @lru_cache
     def sd_fitness(self) -> float:
-        if (len(self.population) < 2):
-            return 0
-
-        return stdev([individual.fitness() for individual in self.population],
-                     self.avg_fitness())
+        return self._fitness_sd
@@ -1,8 +1,11 @@
-from typing import Generic, Type
+from typing import Generic, Type, List, Tuple, Dict
 from abc import ABC, abstractmethod
 
+import numpy as np  #type: ignore
+
 from genetic_framework.chromosome import ChromosomeT
 from genetic_framework.custom_data import CustomDataHolder
+from genetic_framework.rng import rng as shared_rng
 
 
 class Recombiner(Generic[ChromosomeT], CustomDataHolder, ABC):
@@ -13,7 +16,13 @@ class Recombiner(Generic[ChromosomeT], CustomDataHolder, ABC):
     class SubClassRecombiner(Recombiner[SubClassChromosome])...
 
     Then, recombine method can receive SubClassChromosome safely typechecked.
+
+    Subclasses whose recombine always returns the same child for the same
+    couple should set deterministic to True, so repeated couples are only
+    recombined once per batch.
     """
+    deterministic: bool = False
+
     @classmethod
     @abstractmethod
     def recombine(cls: Type, chromosome1: ChromosomeT,
@@ -21,5 +30,37 @@ class Recombiner(Generic[ChromosomeT], CustomDataHolder, ABC):
         """Recombines two Chromosomes into a new one. Subclasses should 
         specify the correct type of Chromosome as parameter.
         (Accordingly to the ChromosomeType specified at the class declaration)
+        Heavy numeric work is best written in a module level function
+        decorated with genetic_framework.jit and called from here.
         """
         ...
+
+    @classmethod
+    def recombine_batch(
+            cls: Type,
+            couples: List[Tuple[ChromosomeT, ChromosomeT]],
+            rng: np.random.Generator = shared_rng) -> List[ChromosomeT]:
+        """Recombines every couple of Chromosomes, returning the new ones in
+        the same order. Default implementation just calls recombine for each
+        couple; subclasses able to recombine many couples at once should
+        override it, drawing their random values from rng (the calling
+        Population's generator). When deterministic, children of repeated couples are
+        clones of the first one.
+        """
+        if not cls.deterministic:
+            return [
+                cls.recombine(chromosome1, chromosome2)
+                for (chromosome1, chromosome2) in couples
+            ]
+
+        children: Dict[Tuple[int, int], ChromosomeT] = {}
+        new_chromosomes: List[ChromosomeT] = []
+        for (chromosome1, chromosome2) in couples:
+            key = (id(chromosome1), id(chromosome2))
+            child = children.get(key)
+            if child is None:
+                children[key] = cls.recombine(chromosome1, chromosome2)
+                new_chromosomes.append(children[key])
+            else:
+                new_chromosomes.append(child.clone())
+        return new_chromosomes
@@ -0,0 +1,25 @@
+"""Random number generation shared by the framework and problem packages.
+
+rng is the single NumPy Generator used by every batched operator,
+selector and chromosome initialization. scalar_random is a Random instance
+for scalar operators that keep off the random module shared instance; the
+others draw from the random module. seed seeds all of them, so a run in a
+single process can be reproduced.
+"""
+import random
+from typing import Optional
+
+import numpy as np  #type: ignore
+
+rng = np.random.default_rng()
+
+scalar_random = random.Random()
+
+
+def seed(value: Optional[int]) -> None:
+    """Seeds rng (inplace, so modules that imported it see the new state),
+    scalar_random and the random module. None seeds them from fresh OS
+    entropy."""
+    rng.bit_generator.state = np.random.default_rng(value).bit_generator.state
+    scalar_random.seed(value)
+    random.seed(value)
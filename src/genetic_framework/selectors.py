@@ -1,23 +1,26 @@
 from abc import ABC, abstractmethod
-from typing import List, Tuple, Dict
-from random import random, shuffle, randint
-from statistics import mean
-from copy import deepcopy
-from operator import lt, le, gt, ge
+from typing import List, Tuple, Dict, Optional, Type
+
+import numpy as np  #type: ignore
 
 from genetic_framework.custom_data import CustomDataHolder
-from genetic_framework.individual import Individual
-from genetic_framework.utils import Roulette
+from genetic_framework.individual import Individual, batch_fitness
+from genetic_framework.utils import Roulette, k_best_indices
+from genetic_framework.rng import rng as shared_rng
 
 
 class MatingSelector(CustomDataHolder, ABC):
     @staticmethod
     @abstractmethod
     def select_couples(
-            population: List[Individual], num_parent_pairs: int,
-            maximize_fitness: bool) -> List[Tuple[Individual, Individual]]:
+            population: List[Individual],
+            num_parent_pairs: int,
+            maximize_fitness: bool,
+            rng: np.random.Generator = shared_rng
+    ) -> List[Tuple[Individual, Individual]]:
         """Pairs individuals to mate and produce children. Subclass should
-        implement this logic of selecting individual to mate."""
+        implement this logic of selecting individual to mate, drawing any
+        random value from rng (the calling Population's generator)."""
 
 
 class SurvivorSelector(CustomDataHolder, ABC):
@@ -25,11 +28,28 @@ class SurvivorSelector(CustomDataHolder, ABC):
     generation. Subclasses should implement this logic."""
     @staticmethod
     @abstractmethod
-    def select_survivors(population_size: int, parents: List[Individual],
+    def select_survivors(population_size: int,
+                         parents: List[Individual],
                          breed: List[Individual],
-                         maximize_fitness: bool) -> List[Individual]:
+                         maximize_fitness: bool,
+                         rng: np.random.Generator = shared_rng
+                         ) -> List[Individual]:
         """Implements logic of choosing which individuals will survive to next
-        generation."""
+        generation, drawing any random value from rng (the calling
+        Population's generator)."""
+
+    @staticmethod
+    def best_survivors(population_size: int, parents: List[Individual],
+                       breed: List[Individual],
+                       maximize_fitness: bool) -> List[Individual]:
+        """Returns the population_size best individuals among parents and
+        breed, best first. Only the selected ones get sorted, so subclasses
+        keeping the fittest individuals should use it instead of sorting
+        everyone."""
+        candidates = parents + breed
+        best = k_best_indices(batch_fitness(candidates), population_size,
+                              maximize_fitness)
+        return [candidates[i] for i in best]
 
 
 class SolutionSelector(ABC):
@@ -40,10 +60,10 @@ class SolutionSelector(ABC):
     def __init__(self,
                  number_solutions: int,
                  maximize_fitness: bool,
-                 custom_data: Dict = {}) -> None:
+                 custom_data: Optional[Dict] = None) -> None:
         self.number_solutions = number_solutions
         self.maximize_fitness = maximize_fitness
-        self.custom_data = custom_data
+        self.custom_data = custom_data if custom_data is not None else {}
 
     @property
     @abstractmethod
@@ -62,189 +82,236 @@ class SolutionSelector(ABC):
 
 
 class BestFitnessMatingSelector(MatingSelector, ABC):
+    """Pairs the best individuals by fitness rank: (best, second), (third,
+    fourth)... Only the 2 * num_pairs selected ones get sorted."""
     @staticmethod
     def select_couples(
-            population: List[Individual], num_pairs: int,
-            maximize_fitness: bool) -> List[Tuple[Individual, Individual]]:
-        population.sort(key=lambda individual: individual.fitness(),
-                        reverse=maximize_fitness)
-        pairs: List[Tuple[Individual, Individual]] = []
-        size = len(population)
-
-        if size <= 1:
+            population: List[Individual],
+            num_pairs: int,
+            maximize_fitness: bool,
+            rng: np.random.Generator = shared_rng
+    ) -> List[Tuple[Individual, Individual]]:
+        if len(population) <= 1:
             return []
 
-        i = 0
-        for i in range(0, 2 * num_pairs, 2):
-            pairs.append((population[i], population[i + 1]))
-
-        return pairs
+        best = k_best_indices(batch_fitness(population), 2 * num_pairs,
+                              maximize_fitness)
+        return [(population[best[i]], population[best[i + 1]])
+                for i in range(0, 2 * num_pairs, 2)]
 
 
 class RandomMatingSelector(MatingSelector, ABC):
     @staticmethod
-    def select_couples(population: List[Individual], num_pairs: int,
-                       __: bool) -> List[Tuple[Individual, Individual]]:
-        pairs: List[Tuple[Individual, Individual]] = []
+    def select_couples(
+            population: List[Individual],
+            num_pairs: int,
+            __: bool,
+            rng: np.random.Generator = shared_rng
+    ) -> List[Tuple[Individual, Individual]]:
         size = len(population)
 
         if size <= 1:
             return []
 
-        for _ in range(num_pairs):
-            p1 = randint(0, size - 1)
-            p2 = randint(0, size - 1)
-            while p1 == p2:
-                p2 = randint(0, size - 1)
-            pairs.append((population[p1], population[p2]))
+        # Second mate is offset from the first, so they are distinct
+        p1 = rng.integers(0, size, num_pairs)
+        p2 = (p1 + 1 + rng.integers(0, size - 1, num_pairs)) % size
 
-        return pairs
+        return [(population[i], population[j])
+                for (i, j) in zip(p1.tolist(), p2.tolist())]
 
 
 class RouletteMatingSelector(MatingSelector, ABC):
     @staticmethod
     def select_couples(
-            population: List[Individual], num_pairs: int,
-            maximize_fitness: bool) -> List[Tuple[Individual, Individual]]:
-        pairs: List[Tuple[Individual, Individual]] = []
-        roulette = Roulette(population, maximize_fitness)
-
+            population: List[Individual],
+            num_pairs: int,
+            maximize_fitness: bool,
+            rng: np.random.Generator = shared_rng
+    ) -> List[Tuple[Individual, Individual]]:
         if len(population) <= 1:
             return []
 
-        for _ in range(num_pairs):
-            mate1 = roulette.get_individual()
-            mate2 = roulette.get_individual()
-
-            while mate2 == mate1:
-                mate2 = roulette.get_individual()
-            pairs.append((mate1, mate2))
-
-        return pairs
+        # Mates are drawn without replacement, so a couple never repeats an
+        # individual
+        mates = Roulette(population, maximize_fitness,
+                         rng=rng).get_many(2 * num_pairs)
+        return [(mates[i], mates[i + 1]) for i in range(0, len(mates), 2)]
 
 
 class BestFromRandomMatingSelector(MatingSelector, ABC):
+    """Every couple is made of the two best among 5 individuals drawn at
+    random (without replacement)."""
     @staticmethod
     def select_couples(
-            population: List[Individual], num_pairs: int,
-            maximize_fitness: bool) -> List[Tuple[Individual, Individual]]:
-        pairs: List[Tuple[Individual, Individual]] = []
-
+            population: List[Individual],
+            num_pairs: int,
+            maximize_fitness: bool,
+            rng: np.random.Generator = shared_rng
+    ) -> List[Tuple[Individual, Individual]]:
         if len(population) <= 1:
             return []
 
         random_count = min(5, len(population))
+        fits = batch_fitness(population)
+        if maximize_fitness:
+            fits = -fits
+
+        # One row of candidates per couple (the individuals with the lowest
+        # random keys of the row, so they are distinct), all drawn with a
+        # single call. The two best of every row are picked at once
+        possible_mates = rng.random(
+            (num_pairs, len(population))).argpartition(
+                random_count - 1, axis=1)[:, :random_count]
+        best_two = np.argsort(fits[possible_mates], axis=1,
+                              kind='stable')[:, :2]
+        mates = np.take_along_axis(possible_mates, best_two, axis=1).tolist()
+
+        return [(population[mate1], population[mate2])
+                for (mate1, mate2) in mates]
+
+
+def _tournament_winners(fits: np.ndarray, keys: np.ndarray,
+                        tournament_size: int) -> np.ndarray:
+    """Internal function returning, for every row of keys (one per
+    tournament, one column per individual), the individual with the lowest
+    fitness among the tournament_size ones with the lowest keys."""
+    contenders = np.argpartition(keys, tournament_size - 1,
+                                 axis=1)[:, :tournament_size]
+    winners: np.ndarray = contenders[np.arange(len(keys)),
+                                     np.argmin(fits[contenders], axis=1)]
+    return winners
+
+
+class TournamentMatingSelector(MatingSelector, ABC):
+    """Picks every parent as the best of tournament_size individuals drawn at
+    random (without replacement), so the population never gets sorted. The
+    second parent's tournament leaves the first parent out, so nobody mates
+    with itself. All tournaments are run at once over the batched fitness
+    array. tournament_size is taken from custom_data (3 when not given,
+    capped by the population size); larger tournaments mean stronger
+    selection pressure."""
+    tournament_size = 3
+
+    @classmethod
+    def set_custom_data(cls, custom_data: Dict) -> None:
+        super().set_custom_data(custom_data)
+        cls.tournament_size = custom_data.get('tournament_size', 3)
+
+    @classmethod
+    def select_couples(
+            cls: Type,
+            population: List[Individual],
+            num_pairs: int,
+            maximize_fitness: bool,
+            rng: np.random.Generator = shared_rng
+    ) -> List[Tuple[Individual, Individual]]:
+        if len(population) <= 1:
+            return []
 
-        for _ in range(num_pairs):
-            shuffle(population)
-            possible_mates = population[:random_count]
-            selected_mates = sorted(
-                possible_mates,
-                key=lambda individual: individual.fitness(),
-                reverse=maximize_fitness)[:2]
-            pairs.append((selected_mates[0], selected_mates[1]))
+        fits = batch_fitness(population)
+        if maximize_fitness:
+            fits = -fits
 
-        return pairs
+        size = len(population)
+        couples = np.arange(num_pairs)
+        # One row of random keys per couple, every tournament is made of the
+        # individuals with the lowest keys of its row
+        mates1 = _tournament_winners(fits, rng.random((num_pairs, size)),
+                                     min(cls.tournament_size, size))
+        keys = rng.random((num_pairs, size))
+        keys[couples, mates1] = np.inf
+        mates2 = _tournament_winners(fits, keys,
+                                     min(cls.tournament_size, size - 1))
+
+        return [(population[mate1], population[mate2])
+                for (mate1, mate2) in zip(mates1.tolist(), mates2.tolist())]
 
 
 class BestFitnessSurvivorSelector(SurvivorSelector, ABC):
     @staticmethod
-    def select_survivors(population_size: int, parents: List[Individual],
+    def select_survivors(population_size: int,
+                         parents: List[Individual],
                          breed: List[Individual],
-                         maximize_fitness: bool) -> List[Individual]:
-        parents.sort(key=lambda individual: individual.fitness(),
-                     reverse=maximize_fitness)
-        breed.sort(key=lambda individual: individual.fitness(),
-                   reverse=maximize_fitness)
-        new_generation_individuals = []
-        comparison = lt if maximize_fitness else gt
-
-        i, j = 0, 0
-        while i + j < population_size:
-            if i == len(parents) and j == len(breed):
-                break
-            if i == len(parents):
-                new_generation_individuals.append(breed[j])
-                j += 1
-            elif j == len(breed):
-                new_generation_individuals.append(parents[i])
-                i += 1
-            elif comparison(parents[i].fitness(), breed[j].fitness()):
-                new_generation_individuals.append(breed[j])
-                j += 1
-            else:
-                new_generation_individuals.append(parents[i])
-                i += 1
-
-        return new_generation_individuals
+                         maximize_fitness: bool,
+                         rng: np.random.Generator = shared_rng
+                         ) -> List[Individual]:
+        return SurvivorSelector.best_survivors(population_size, parents,
+                                               breed, maximize_fitness)
 
 
 class BestBreedFitnessSurvivorSelector(SurvivorSelector, ABC):
     @staticmethod
-    def select_survivors(population_size: int, _: List[Individual],
+    def select_survivors(population_size: int,
+                         _: List[Individual],
                          breed: List[Individual],
-                         maximize_fitness: bool) -> List[Individual]:
-        breed.sort(key=lambda individual: individual.fitness(),
-                   reverse=maximize_fitness)
-        return breed[:population_size]
+                         maximize_fitness: bool,
+                         rng: np.random.Generator = shared_rng
+                         ) -> List[Individual]:
+        return SurvivorSelector.best_survivors(population_size, [], breed,
+                                               maximize_fitness)
 
 
 class BestParentPlusBestBreedFitnessSurvivorSelector(SurvivorSelector, ABC):
     @staticmethod
-    def select_survivors(population_size: int, parents: List[Individual],
+    def select_survivors(population_size: int,
+                         parents: List[Individual],
                          breed: List[Individual],
-                         maximize_fitness: bool) -> List[Individual]:
-        parents.sort(key=lambda individual: individual.fitness(),
-                     reverse=maximize_fitness)
-        breed.sort(key=lambda individual: individual.fitness(),
-                   reverse=maximize_fitness)
-
-        return parents[0:1] + breed[:population_size - 1]
+                         maximize_fitness: bool,
+                         rng: np.random.Generator = shared_rng
+                         ) -> List[Individual]:
+        best_parent = SurvivorSelector.best_survivors(1, parents, [],
+                                                      maximize_fitness)
+        return best_parent + SurvivorSelector.best_survivors(
+            population_size - 1, [], breed, maximize_fitness)
 
 
 class RouletteSurvivorSelector(SurvivorSelector, ABC):
     @staticmethod
-    def select_survivors(population_size: int, parents: List[Individual],
+    def select_survivors(population_size: int,
+                         parents: List[Individual],
                          breed: List[Individual],
-                         maximize_fitness: bool) -> List[Individual]:
-        new_generation_individuals: List[Individual] = []
-        roulette = Roulette(parents + breed, maximize_fitness)
-
-        return [roulette.get_individual() for _ in range(population_size)]
+                         maximize_fitness: bool,
+                         rng: np.random.Generator = shared_rng
+                         ) -> List[Individual]:
+        roulette = Roulette(parents + breed, maximize_fitness, rng=rng)
+        return roulette.get_many(population_size)
 
 
 class GenerationalSurvivorSelector(SurvivorSelector, ABC):
+    """Ranks individuals by fitness and generation, each relative to its
+    average among parents and breed."""
     @staticmethod
-    def select_survivors(population_size: int, parents: List[Individual],
+    def select_survivors(population_size: int,
+                         parents: List[Individual],
                          breed: List[Individual],
-                         maximize_fitness: bool) -> List[Individual]:
+                         maximize_fitness: bool,
+                         rng: np.random.Generator = shared_rng
+                         ) -> List[Individual]:
         new_generation_individuals = parents + breed
 
-        avg_gen = mean([
-            individual.generation for individual in new_generation_individuals
-        ])
+        generations = np.fromiter(
+            (individual.generation
+             for individual in new_generation_individuals),
+            dtype=np.float64,
+            count=len(new_generation_individuals))
+        avg_gen = float(np.mean(generations))
         avg_gen = 1.0 if avg_gen == 0.0 else avg_gen
 
-        avg_fitness = mean([
-            individual.fitness() for individual in new_generation_individuals
-        ])
+        fits = batch_fitness(new_generation_individuals)
+        avg_fitness = float(np.mean(fits))
         avg_fitness = 1.0 if avg_fitness == 0.0 else avg_fitness
 
-        def score(ind: Individual) -> float:
-            fitness = ind.fitness()
-            gen = ind.generation
-
-            return (fitness / avg_fitness) * (gen / avg_gen)
-
-        new_generation_individuals.sort(key=score, reverse=maximize_fitness)
-        return new_generation_individuals[:population_size]
+        scores = (fits / avg_fitness) * (generations / avg_gen)
+        best = k_best_indices(scores, population_size, maximize_fitness)
+        return [new_generation_individuals[i] for i in best]
 
 
 class KBestFitnessSolutionSelector(SolutionSelector, ABC):
     def __init__(self,
                  number_solutions: int,
                  maximize_fitness: bool,
-                 custom_data: Dict = {}) -> None:
+                 custom_data: Optional[Dict] = None) -> None:
         super().__init__(number_solutions, maximize_fitness, custom_data)
         self._best_individuals: List[Individual] = []
 
@@ -257,30 +324,14 @@ class KBestFitnessSolutionSelector(SolutionSelector, ABC):
         return self._best_individuals
 
     def update_individuals(self, population: List[Individual]) -> None:
-        self.best_individuals.sort(key=lambda individual: individual.fitness(),
-                                   reverse=self.maximize_fitness)
-        population.sort(key=lambda individual: individual.fitness(),
-                        reverse=self.maximize_fitness)
-        new_best_individuals: List[Individual] = []
-        comparison = ge if self.maximize_fitness else le
-
-        i, j = 0, 0
-        while len(new_best_individuals) < self.number_solutions:
-            if i == len(population) and j == len(self.best_individuals):
-                break
-            elif i == len(population):
-                new_best_individuals.append(self.best_individuals[j])
-                j += 1
-            elif j == len(self.best_individuals):
-                new_best_individuals.append(deepcopy(population[i]))
-                i += 1
-            elif comparison(self.best_individuals[j].fitness(),
-                            population[i].fitness()):
-                new_best_individuals.append(self.best_individuals[j])
-                j += 1
-            else:
-                new_best_individuals.append(deepcopy(population[i]))
-                i += 1
-
-        self.best_individuals.clear()
-        self.best_individuals.extend(new_best_individuals)
+        # Kept individuals come first, so they win ties against newcomers
+        candidates = self._best_individuals + population
+        best = k_best_indices(batch_fitness(candidates),
+                              self.number_solutions, self.maximize_fitness)
+
+        num_kept = len(self._best_individuals)
+        # Newcomers are cloned, the population may change them later
+        self._best_individuals = [
+            candidates[i] if i < num_kept else candidates[i].clone()
+            for i in best
+        ]
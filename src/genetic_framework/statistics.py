@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Dict, TypeVar, Generic, List, Tuple
+from typing import Dict, TypeVar, Generic, List, Tuple, Optional
 
 from genetic_framework.population import Population
 from genetic_framework.selectors import SolutionSelector
@@ -9,8 +9,8 @@ DataPoint = TypeVar('DataPoint')
 
 class StatisticsCollector(Generic[DataPoint], ABC):
     @abstractmethod
-    def __init__(self, custom_data: Dict = {}) -> None:
-        self.custom_data = custom_data
+    def __init__(self, custom_data: Optional[Dict] = None) -> None:
+        self.custom_data = custom_data if custom_data is not None else {}
 
     @abstractmethod
     def collect_data_point(self, population: Population, \
@@ -33,7 +33,7 @@ class StatisticsCollector(Generic[DataPoint], ABC):
 
 class AvgFitnessPerGenerationStatisticsCollector(
         StatisticsCollector[Tuple[int, float]]):
-    def __init__(self, custom_data: Dict = {}) -> None:
+    def __init__(self, custom_data: Optional[Dict] = None) -> None:
         super().__init__(custom_data)
         self._data: List[Tuple[int, float]] = []
 
@@ -54,7 +54,7 @@ class AvgFitnessPerGenerationStatisticsCollector(
 
 class FitnessSDPerGenerationStatisticsCollector(
         StatisticsCollector[Tuple[int, float]]):
-    def __init__(self, custom_data: Dict = {}) -> None:
+    def __init__(self, custom_data: Optional[Dict] = None) -> None:
         super().__init__(custom_data)
         self._data: List[Tuple[int, float]] = []
 
@@ -75,7 +75,7 @@ class FitnessSDPerGenerationStatisticsCollector(
 
 class BestFitnessPerGenerationStatisticsCollector(
         StatisticsCollector[Tuple[int, float]]):
-    def __init__(self, custom_data: Dict = {}) -> None:
+    def __init__(self, custom_data: Optional[Dict] = None) -> None:
         super().__init__(custom_data)
         self._data: List[Tuple[int, float]] = []
 
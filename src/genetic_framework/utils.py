@@ -1,41 +1,104 @@
-from random import randint, random
 from typing import List
 
-from genetic_framework.individual import Individual
+import numpy as np  #type: ignore
+
+from genetic_framework.individual import Individual, batch_fitness
+from genetic_framework.rng import rng as shared_rng
 
 
 class Roulette:
+    """Fitness proportional selection over a population.
+
+    Individuals and their accumulated fitness are kept in two parallel
+    containers (a list and a float64 array) so drawing an individual is a
+    binary search over the accumulated fitness. Draws come from rng.
+    """
     def __init__(self,
                  population: List[Individual],
                  maximize_fitness: bool,
-                 replacement: bool = False):
-        population.sort(key=lambda individual: individual.fitness(),
-                        reverse=maximize_fitness)
+                 replacement: bool = False,
+                 rng: np.random.Generator = shared_rng):
         self.replacement = replacement
-        self._items: List[Roulette.Item] = list(
-            map(
-                lambda individual: Roulette.Item(individual,
-                                                 individual.fitness()),
-                population))
-
-        for i in range(1, len(self._items)):
-            self._items[i].acc_probability += self._items[i -
-                                                          1].acc_probability
+        self._rng = rng
+        self._individuals: List[Individual] = list(population)
+        self._acc: np.ndarray = np.cumsum(batch_fitness(population))
 
     def get_individual(self) -> Individual:
-        r = random() * self._items[-1].acc_probability
-        try:
-            selected_item = next(item for item in self._items
-                                 if r <= item.acc_probability)
-        except StopIteration:
+        total = self._acc[-1]
+        if total > 0.0:
+            r = self._rng.random() * total
+            idx = int(np.searchsorted(self._acc, r, side='right'))
+        else:
             # When everyone has fitness 0.0, just take random one
-            r2 = randint(0, len(self._items) - 1)
-            selected_item = self._items[r2]
-        self._items.remove(selected_item)
-        return selected_item.individual
-
-    class Item:
-        def __init__(self, individual: Individual,
-                     acc_probability: float) -> None:
-            self.individual = individual
-            self.acc_probability = acc_probability
+            idx = int(self._rng.integers(0, len(self._individuals)))
+
+        selected_individual = self._individuals[idx]
+        if not self.replacement:
+            self._remove(idx)
+        return selected_individual
+
+    def get_many(self, k: int) -> List[Individual]:
+        """Draws k individuals at once, as k get_individual calls would."""
+        total = self._acc[-1]
+        if self.replacement:
+            if total > 0.0:
+                idxs = np.searchsorted(self._acc,
+                                       self._rng.random(k) * total,
+                                       side='right')
+            else:
+                idxs = self._rng.integers(0, len(self._individuals), k)
+            return [self._individuals[i] for i in idxs]
+
+        weights = np.diff(self._acc, prepend=0.0)
+        if np.count_nonzero(weights) < k:
+            # Not enough weighted individuals, some draws are random ones
+            return [self.get_individual() for _ in range(k)]
+
+        idxs = self._rng.choice(len(weights),
+                                k,
+                                replace=False,
+                                p=weights / total)
+        selected = [self._individuals[i] for i in idxs]
+
+        keep = np.ones(len(weights), dtype=bool)
+        keep[idxs] = False
+        self._individuals = [
+            individual
+            for (individual, kept) in zip(self._individuals, keep) if kept
+        ]
+        self._acc = np.cumsum(weights[keep])
+        return selected
+
+    def _remove(self, idx: int) -> None:
+        """Internal method used to drop the individual at idx from the
+        roulette, shifting the accumulated fitness of the ones after it."""
+        weight = self._acc[idx] - (self._acc[idx - 1] if idx > 0 else 0.0)
+        self._acc[idx + 1:] -= weight
+        self._acc = np.delete(self._acc, idx)
+        del self._individuals[idx]
+
+
+def k_best_indices(fits: np.ndarray, k: int,
+                   maximize_fitness: bool) -> np.ndarray:
+    """Returns the indices of the k best fitness values, best first. Uses a
+    partial partition so only the selected k values get sorted. Ties are
+    broken by position (lower index first), as a stable sort would, so
+    callers listing kept individuals first keep them over equal ones."""
+    if maximize_fitness:
+        fits = -fits
+
+    if k <= 0:
+        idx = np.arange(0)
+    elif k < len(fits):
+        # argpartition is not stable, so only values strictly better than
+        # the k-th one come from the partition; ties with it are taken in
+        # index order
+        kth = np.partition(fits, k - 1)[k - 1]
+        better = np.flatnonzero(fits < kth)
+        ties = np.flatnonzero(fits == kth)[:k - len(better)]
+        idx = np.concatenate([better, ties])
+    else:
+        idx = np.arange(len(fits))
+
+    best: np.ndarray = idx[np.argsort(fits[idx], kind='stable')]
+    return best
@@ -3,15 +3,17 @@
 This module instantiate genetic algorithm framework to find solutions for the
 eight queen problem.
 """
+import cProfile
 from argparse import ArgumentParser, Action
 from typing import Type, Any, List
 from enum import Enum
 from math import pi
 
-import matplotlib.pyplot as plt  # type: ignore
-import matplotlib.patches as mpatches  # type: ignore
+import numpy as np  #type: ignore
 
 from genetic_framework.experiment import Experiment
+from genetic_framework.islands import IslandExperiment
+from genetic_framework.rng import seed
 from genetic_framework.mutator import *
 from genetic_framework.statistics import *
 from genetic_framework.selectors import *
@@ -68,6 +70,7 @@ class MatingSelectorEnum(Enum):
     ROULETTE = RouletteMatingSelector
     BEST_FROM_RAND = BestFromRandomMatingSelector
     RANDOM = RandomMatingSelector
+    TOURNAMENT = TournamentMatingSelector
 
 
 class SolutionSelectorEnum(Enum):
@@ -137,6 +140,16 @@ class CheckPositiveIntegerConstraintAction(Action):
         setattr(namespace, self.dest, values)
 
 
+class CheckBinaryConstraintAction(Action):
+    """Class responsible for sanitizing binary (0 or 1) CLI inputs"""
+    def __call__(self, parser, namespace, values, option_string=None) -> None:
+        if values not in (0, 1):
+            raise ValueError(
+                "{} flag must be either 0 or 1: {}".format(
+                    option_string, values))
+        setattr(namespace, self.dest, values)
+
+
 class NoConstraintAction(Action):
     """Dummy Action for arguments with no constraints"""
     def __call__(self, parser, namespace, values, option_string=None) -> None:
@@ -256,8 +269,75 @@ ARGS = [
         full_name='max_fitness_comp',
         value_name='MAX_FIT_COMPS',
         help_message="""Maximum number of fitness computations allowed to be 
-            done before algorithm stops.""",
+            done before algorithm stops. Fitness values reused from the fitness
+            cache (repeated chromosomes) are not computations.""",
+        action_cls=CheckPositiveIntegerConstraintAction),
+    CLIArgumentDescription(
+        _type=int,
+        default_value=1,
+        short_name='fw',
+        full_name='fitness_workers',
+        value_name='FITNESS_WORKERS',
+        help_message="""Number of worker processes used to compute fitness. 
+            Use 1 to compute it in the main process.""",
+        action_cls=CheckPositiveIntegerConstraintAction),
+    CLIArgumentDescription(
+        _type=int,
+        default_value=1,
+        short_name='ni',
+        full_name='num_islands',
+        value_name='NUM_ISLANDS',
+        help_message="""Number of islands (populations evolving in parallel 
+            processes, exchanging their best individuals). Population size and 
+            max fitness computations are split among them. Use 1 to evolve a 
+            single population.""",
+        action_cls=CheckPositiveIntegerConstraintAction),
+    CLIArgumentDescription(
+        _type=int,
+        default_value=10,
+        short_name='mi',
+        full_name='migration_interval',
+        value_name='MIGRATION_INTERVAL',
+        help_message="""Number of generations between migrations when using 
+            islands.""",
+        action_cls=CheckPositiveIntegerConstraintAction),
+    CLIArgumentDescription(
+        _type=int,
+        default_value=3,
+        short_name='ts',
+        full_name='tournament_size',
+        value_name='TOURNAMENT_SIZE',
+        help_message="""Number of individuals competing for each parent when
+            using the TOURNAMENT mating selector.""",
         action_cls=CheckPositiveIntegerConstraintAction),
+    CLIArgumentDescription(
+        _type=int,
+        default_value=1,
+        short_name='pl',
+        full_name='plot',
+        value_name='PLOT',
+        help_message="""Whether to plot the fitness statistics at the end of
+            the experiment (1) or not (0). matplotlib is only imported when
+            plotting.""",
+        action_cls=CheckBinaryConstraintAction),
+    CLIArgumentDescription(
+        _type=str,
+        default_value=None,
+        short_name='prof',
+        full_name='profile',
+        value_name='PROFILE_FILE',
+        help_message="""Run the experiment under cProfile and write its stats
+            to PROFILE_FILE (readable with pstats).""",
+        action_cls=NoConstraintAction),
+    CLIArgumentDescription(
+        _type=int,
+        default_value=None,
+        short_name='sd',
+        full_name='seed',
+        value_name='SEED',
+        help_message="""Seed for the random number generators, so runs can be
+            reproduced. Island and fitness worker processes are not seeded.""",
+        action_cls=NoConstraintAction),
     CLIArgumentDescription(
         _type=int,
         default_value=1,
@@ -379,6 +459,8 @@ STATISTICS_COLLECTOR_TYPES = [
 
 def main(**kwargs) -> None:
     print('Using these CLI arguments: {}\n'.format(kwargs))
+    if kwargs['seed'] is not None:
+        seed(kwargs['seed'])
 
     custom_data = dict(
         n=kwargs['n'],
@@ -390,7 +472,8 @@ def main(**kwargs) -> None:
         mutator_fitness_scale=kwargs['mutator_fitness_scale'],
         step_size=kwargs['step_size'],
         learning_rate_multiplier=kwargs['learning_rate_multiplier'],
-        fitness_computer=kwargs['fitness_computer'])
+        fitness_computer=kwargs['fitness_computer'],
+        tournament_size=kwargs['tournament_size'])
 
     experiment = Experiment(
         kwargs['population_size'], kwargs['max_generations'],
@@ -401,8 +484,13 @@ def main(**kwargs) -> None:
         kwargs['chromosome'], kwargs['fitness_computer'], False,
         kwargs['mutator'], kwargs['recombiner'], kwargs['mating_selector'],
         kwargs['survivor_selector'], kwargs['solution_selector'],
-        STATISTICS_COLLECTOR_TYPES, custom_data)
-    best_individuals, stats_collectors = experiment.run_experiment()
+        STATISTICS_COLLECTOR_TYPES, custom_data, kwargs['fitness_workers'])
+    if kwargs['num_islands'] > 1:
+        best_individuals, stats_collectors = IslandExperiment(
+            experiment, kwargs['num_islands'],
+            kwargs['migration_interval']).run_experiment()
+    else:
+        best_individuals, stats_collectors = experiment.run_experiment()
 
     print('\nSolutions:')
     for individual in best_individuals:
@@ -411,22 +499,26 @@ def main(**kwargs) -> None:
         print(individual.chromosome.genotypes)
         print('\n')
 
-    plot_experiment_statistics(stats_collectors)
+    if kwargs['plot']:
+        plot_experiment_statistics(stats_collectors)
 
 
 def plot_experiment_statistics(stats: List[StatisticsCollector]) -> None:
+    import matplotlib.pyplot as plt  # type: ignore
+    import matplotlib.patches as mpatches  # type: ignore
+
     avg_fitness_per_generation = stats[0]
     best_fitness_per_generation = stats[1]
     sd_fitness_per_generation = stats[2]
 
-    x_all, y_avg, y_best, y_sd, y_sdinv = [], [], [], [], []
+    # (generation, value) data points as (n, 2) arrays, sliced per column
+    avg_data = np.asarray(avg_fitness_per_generation.data).reshape(-1, 2)
+    best_data = np.asarray(best_fitness_per_generation.data).reshape(-1, 2)
+    sd_data = np.asarray(sd_fitness_per_generation.data).reshape(-1, 2)
 
-    for i, (x, y) in enumerate(avg_fitness_per_generation.data):
-        x_all.append(x)
-        y_avg.append(y)
-        y_best.append(best_fitness_per_generation.data[i][1])
-        y_sd.append(y + sd_fitness_per_generation.data[i][1])
-        y_sdinv.append(y - sd_fitness_per_generation.data[i][1])
+    x_all, y_avg = avg_data[:, 0], avg_data[:, 1]
+    y_best = best_data[:, 1]
+    y_sd, y_sdinv = y_avg + sd_data[:, 1], y_avg - sd_data[:, 1]
 
     plt.fill_between(x_all, y_sd, color='lightcoral')
     plt.fill_between(x_all, y_sdinv, color='white')
@@ -456,4 +548,8 @@ if __name__ == '__main__':
                             default=arg.default_value)
     args = parser.parse_args()
 
-    main(**args.__dict__)
+    if args.profile is not None:
+        cProfile.runctx('main(**kwargs)', globals(),
+                        {'kwargs': args.__dict__}, args.profile)
+    else:
+        main(**args.__dict__)
@@ -3,21 +3,23 @@
 This module instantiate genetic algorithm framework to find solutions for the
 function minimization problem.
 """
+import cProfile
 from argparse import ArgumentParser, Action
 from typing import Type, Any
 from enum import Enum
 
-import matplotlib.pyplot as plt  # type: ignore
-import matplotlib.patches as mpatches  # type: ignore
-
 from function_minimization.chromosomes import FloatVectorChromosome
 from function_minimization.phenotypes import FloatPhenotype
 from function_minimization.genotypes import FloatGenotype
 from function_minimization.fitness import ChallengeFitnessComputer
 from function_minimization.mutators import RandomizeGeneMutator
-from function_minimization.recombiners import RandomInterpolationRecombiner
+from function_minimization.recombiners import RandomInterpolationRecombiner, UniformCrossoverRecombiner
 from function_minimization.selectors import MinimizeFitnessMatingSelector, MinimizeFitnessSurvivorSelector, KLowerFitnessSolutionSelector
+from function_minimization.kernels import warm_up
 from genetic_framework.experiment import Experiment
+from genetic_framework.selectors import TournamentMatingSelector
+from genetic_framework.islands import IslandExperiment
+from genetic_framework.rng import seed
 from genetic_framework.statistics import *
 
 PROGRAM_DESCRIPTION = "Minimizes a function through genetic algorithm"
@@ -41,6 +43,7 @@ class MutatorEnum(Enum):
 
 class RecombinerEnum(Enum):
     RANDOM_INTERPOLATION = RandomInterpolationRecombiner
+    UNIFORM_CROSSOVER = UniformCrossoverRecombiner
 
 
 class SurvivorSelectorEnum(Enum):
@@ -49,6 +52,7 @@ class SurvivorSelectorEnum(Enum):
 
 class MatingSelectorEnum(Enum):
     MINIMIZE_FITNESS = MinimizeFitnessMatingSelector
+    TOURNAMENT = TournamentMatingSelector
 
 
 class SolutionSelectorEnum(Enum):
@@ -118,6 +122,16 @@ class CheckPositiveIntegerConstraintAction(Action):
         setattr(namespace, self.dest, values)
 
 
+class CheckBinaryConstraintAction(Action):
+    """Class responsible for sanitizing binary (0 or 1) CLI inputs"""
+    def __call__(self, parser, namespace, values, option_string=None) -> None:
+        if values not in (0, 1):
+            raise ValueError(
+                "{} flag must be either 0 or 1: {}".format(
+                    option_string, values))
+        setattr(namespace, self.dest, values)
+
+
 class NoConstraintAction(Action):
     """Dummy Action for arguments with no constraints"""
     def __call__(self, parser, namespace, values, option_string=None) -> None:
@@ -196,8 +210,75 @@ ARGS = [
         full_name='max_fitness_comp',
         value_name='MAX_FIT_COMPS',
         help_message="""Maximum number of fitness computations allowed to be 
-            done before algorithm stops.""",
+            done before algorithm stops. Fitness values reused from the fitness
+            cache (repeated chromosomes) are not computations.""",
+        action_cls=CheckPositiveIntegerConstraintAction),
+    CLIArgumentDescription(
+        _type=int,
+        default_value=1,
+        short_name='fw',
+        full_name='fitness_workers',
+        value_name='FITNESS_WORKERS',
+        help_message="""Number of worker processes used to compute fitness. 
+            Use 1 to compute it in the main process.""",
+        action_cls=CheckPositiveIntegerConstraintAction),
+    CLIArgumentDescription(
+        _type=int,
+        default_value=1,
+        short_name='ni',
+        full_name='num_islands',
+        value_name='NUM_ISLANDS',
+        help_message="""Number of islands (populations evolving in parallel 
+            processes, exchanging their best individuals). Population size and 
+            max fitness computations are split among them. Use 1 to evolve a 
+            single population.""",
+        action_cls=CheckPositiveIntegerConstraintAction),
+    CLIArgumentDescription(
+        _type=int,
+        default_value=10,
+        short_name='mi',
+        full_name='migration_interval',
+        value_name='MIGRATION_INTERVAL',
+        help_message="""Number of generations between migrations when using 
+            islands.""",
         action_cls=CheckPositiveIntegerConstraintAction),
+    CLIArgumentDescription(
+        _type=int,
+        default_value=3,
+        short_name='ts',
+        full_name='tournament_size',
+        value_name='TOURNAMENT_SIZE',
+        help_message="""Number of individuals competing for each parent when
+            using the TOURNAMENT mating selector.""",
+        action_cls=CheckPositiveIntegerConstraintAction),
+    CLIArgumentDescription(
+        _type=int,
+        default_value=1,
+        short_name='pl',
+        full_name='plot',
+        value_name='PLOT',
+        help_message="""Whether to plot the fitness statistics at the end of
+            the experiment (1) or not (0). matplotlib is only imported when
+            plotting.""",
+        action_cls=CheckBinaryConstraintAction),
+    CLIArgumentDescription(
+        _type=str,
+        default_value=None,
+        short_name='prof',
+        full_name='profile',
+        value_name='PROFILE_FILE',
+        help_message="""Run the experiment under cProfile and write its stats
+            to PROFILE_FILE (readable with pstats).""",
+        action_cls=NoConstraintAction),
+    CLIArgumentDescription(
+        _type=int,
+        default_value=None,
+        short_name='sd',
+        full_name='seed',
+        value_name='SEED',
+        help_message="""Seed for the random number generators, so runs can be
+            reproduced. Island and fitness worker processes are not seeded.""",
+        action_cls=NoConstraintAction),
     CLIArgumentDescription(
         _type=int,
         default_value=30,
@@ -309,6 +390,10 @@ STATISTICS_COLLECTOR_TYPES = [
 
 def main(**kwargs) -> None:
     print('Using these CLI arguments: {}\n'.format(kwargs))
+    if kwargs['seed'] is not None:
+        seed(kwargs['seed'])
+    # Compile kernels before the experiment so generation 1 isn't slowed down
+    warm_up()
 
     experiment = Experiment(
         kwargs['population_size'], kwargs['max_generations'],
@@ -322,8 +407,15 @@ def main(**kwargs) -> None:
         STATISTICS_COLLECTOR_TYPES,
         dict(parameter_lower_bound=kwargs['parameter_lower_bound'],
              parameter_upper_bound=kwargs['parameter_upper_bound'],
-             vector_size=kwargs['vector_size']))
-    best_individuals, stats_collectors = experiment.run_experiment()
+             vector_size=kwargs['vector_size'],
+             tournament_size=kwargs['tournament_size']),
+        kwargs['fitness_workers'])
+    if kwargs['num_islands'] > 1:
+        best_individuals, stats_collectors = IslandExperiment(
+            experiment, kwargs['num_islands'],
+            kwargs['migration_interval']).run_experiment()
+    else:
+        best_individuals, stats_collectors = experiment.run_experiment()
 
     print('\nSolutions:')
     for individual in best_individuals:
@@ -332,6 +424,12 @@ def main(**kwargs) -> None:
         print(individual)
         print('\n')
 
+    if not kwargs['plot']:
+        return
+
+    import matplotlib.pyplot as plt  # type: ignore
+    import matplotlib.patches as mpatches  # type: ignore
+
     avg_fitness_per_generation = stats_collectors[0]
     best_fitness_per_generation = stats_collectors[1]
     sd_fitness_per_generation = stats_collectors[2]
@@ -379,4 +477,8 @@ if __name__ == '__main__':
                             default=arg.default_value)
     args = parser.parse_args()
 
-    main(**args.__dict__)
+    if args.profile is not None:
+        cProfile.runctx('main(**kwargs)', globals(),
+                        {'kwargs': args.__dict__}, args.profile)
+    else:
+        main(**args.__dict__)
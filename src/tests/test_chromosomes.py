@@ -0,0 +1,112 @@
+import unittest
+from collections import Counter
+from typing import List, Tuple
+
+import numpy as np  #type: ignore
+
+from eight_queens.chromosomes import BitStringChromosome, IntPermutationChromosome
+from function_minimization.chromosomes import FloatVectorChromosome
+from genetic_framework.rng import seed
+
+DRAWS = 12000
+
+
+def permutation(chromosome: IntPermutationChromosome) -> Tuple[int, ...]:
+    return tuple(gene.data for gene in chromosome.genotypes)
+
+
+def is_single_cycle(values: Tuple[int, ...]) -> bool:
+    position = values[0]
+    length = 1
+    while position != 0:
+        position = values[position]
+        length += 1
+    return length == len(values)
+
+
+class IntPermutationInitializeBatchTest(unittest.TestCase):
+    def setUp(self) -> None:
+        seed(0)
+
+    def test_matches_initialize(self) -> None:
+        custom_data = {'chess_size': 4}
+        batch = [
+            permutation(chromosome)
+            for chromosome in IntPermutationChromosome.initialize_batch(
+                DRAWS, custom_data)
+        ]
+        scalar: List[Tuple[int, ...]] = []
+        for _ in range(DRAWS):
+            chromosome = IntPermutationChromosome(custom_data)
+            chromosome.initialize()
+            scalar.append(permutation(chromosome))
+
+        # Both draw the (4 - 1)! single cycle permutations, uniformly
+        self.assertTrue(all(map(is_single_cycle, batch)))
+        batch_counts = Counter(batch)
+        scalar_counts = Counter(scalar)
+        self.assertEqual(set(batch_counts), set(scalar_counts))
+        self.assertEqual(len(batch_counts), 6)
+        for count in batch_counts.values():
+            self.assertAlmostEqual(count / DRAWS, 1 / 6, delta=0.02)
+
+    def test_genes_are_not_shared(self) -> None:
+        chromosomes = IntPermutationChromosome.initialize_batch(
+            2, {'chess_size': 8})
+        self.assertEqual(
+            sorted(permutation(chromosomes[0])), list(range(8)))
+        for (gene1, gene2) in zip(chromosomes[0].genotypes,
+                                  chromosomes[1].genotypes):
+            self.assertIsNot(gene1, gene2)
+
+
+class FloatVectorInitializeBatchTest(unittest.TestCase):
+    custom_data = dict(parameter_lower_bound=-2.0,
+                       parameter_upper_bound=3.0,
+                       vector_size=4)
+
+    def setUp(self) -> None:
+        seed(0)
+
+    def test_matches_initialize(self) -> None:
+        batch = FloatVectorChromosome.stack(
+            FloatVectorChromosome.initialize_batch(DRAWS, self.custom_data))
+        scalar_chromosomes = []
+        for _ in range(DRAWS):
+            chromosome = FloatVectorChromosome(self.custom_data)
+            chromosome.initialize()
+            scalar_chromosomes.append(chromosome)
+        scalar = FloatVectorChromosome.stack(scalar_chromosomes)
+
+        self.assertEqual(batch.shape, (DRAWS, 4))
+        self.assertTrue(np.all((batch >= -2.0) & (batch <= 3.0)))
+        # Uniform in the boundaries, as initialize
+        np.testing.assert_allclose(batch.mean(axis=0), scalar.mean(axis=0),
+                                   atol=0.1)
+        np.testing.assert_allclose(batch.mean(axis=0), [0.5] * 4, atol=0.1)
+
+    def test_rows_own_their_data(self) -> None:
+        chromosomes = FloatVectorChromosome.initialize_batch(
+            2, self.custom_data)
+        data = chromosomes[1].data.copy()
+
+        chromosomes[0].data[:] = 0.0
+        np.testing.assert_array_equal(chromosomes[1].data, data)
+        self.assertIsNone(chromosomes[0].data.base)
+
+
+class DefaultInitializeBatchTest(unittest.TestCase):
+    def test_initializes_each_chromosome(self) -> None:
+        chromosomes = BitStringChromosome.initialize_batch(
+            5, {'chess_size': 8})
+
+        self.assertEqual(len(chromosomes), 5)
+        for chromosome in chromosomes:
+            self.assertIsInstance(chromosome, BitStringChromosome)
+            self.assertEqual(len(chromosome.genotypes), 8)
+            self.assertTrue(
+                all(0 <= gene.value < 8 for gene in chromosome.genotypes))
+
+
+if __name__ == '__main__':
+    unittest.main()
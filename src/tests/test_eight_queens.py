@@ -0,0 +1,91 @@
+import unittest
+from typing import List, Type
+
+import numpy as np  #type: ignore
+
+from eight_queens.chromosomes import BitStringChromosome, IntPermutationChromosome
+from genetic_framework.chromosome import Chromosome
+from genetic_framework.fitness import FitnessComputer
+from eight_queens.fitness import BitStringFitnessComputer, BooleanBitStringFitnessComputer, IntPermutationFitnessComputer, BooleanIntPermutationFitnessComputer
+
+CUSTOM_DATA = {'chess_size': 8}
+
+
+class FitnessBatchTest(unittest.TestCase):
+    def assert_batch_matches_fitness(
+            self, fitness_computer_cls: Type[FitnessComputer],
+            chromosomes: List) -> None:
+        np.testing.assert_array_equal(
+            fitness_computer_cls.fitness_batch(chromosomes), [
+                fitness_computer_cls.fitness(chromosome)
+                for chromosome in chromosomes
+            ])
+
+    def test_bit_string_batch_matches_fitness(self) -> None:
+        chromosomes = BitStringChromosome.initialize_batch(200, CUSTOM_DATA)
+        for fitness_computer_cls in (BitStringFitnessComputer,
+                                     BooleanBitStringFitnessComputer):
+            self.assert_batch_matches_fitness(fitness_computer_cls,
+                                              chromosomes)
+
+    def test_permutation_batch_matches_fitness(self) -> None:
+        chromosomes = IntPermutationChromosome.initialize_batch(
+            200, CUSTOM_DATA)
+        for fitness_computer_cls in (IntPermutationFitnessComputer,
+                                     BooleanIntPermutationFitnessComputer):
+            self.assert_batch_matches_fitness(fitness_computer_cls,
+                                              chromosomes)
+
+    def test_known_boards(self) -> None:
+        solution = IntPermutationChromosome(CUSTOM_DATA)
+        solution.initialize()
+        for (gene, row) in zip(solution.genotypes, [0, 4, 7, 5, 2, 6, 1, 3]):
+            gene.data = row
+        # Every queen on the main diagonal attacks all the others
+        diagonal = IntPermutationChromosome(CUSTOM_DATA)
+        diagonal.initialize()
+        for (row, gene) in enumerate(diagonal.genotypes):
+            gene.data = row
+
+        self.assertEqual(
+            IntPermutationFitnessComputer.fitness_batch([solution,
+                                                         diagonal]).tolist(),
+            [1.0, 1 / 29])
+        self.assertEqual(
+            BooleanIntPermutationFitnessComputer.fitness_batch(
+                [solution, diagonal]).tolist(), [1.0, 0.0])
+
+    def test_empty_batch(self) -> None:
+        for fitness_computer_cls in (BitStringFitnessComputer,
+                                     BooleanBitStringFitnessComputer,
+                                     IntPermutationFitnessComputer,
+                                     BooleanIntPermutationFitnessComputer):
+            self.assertEqual(fitness_computer_cls.fitness_batch([]).shape,
+                             (0, ))
+
+
+class CloneTest(unittest.TestCase):
+    def test_clone_copies_genes(self) -> None:
+        chromosome_classes: List[Type[Chromosome]] = [
+            BitStringChromosome, IntPermutationChromosome
+        ]
+        for chromosome_cls in chromosome_classes:
+            chromosome = chromosome_cls.initialize_batch(1, CUSTOM_DATA)[0]
+            key = chromosome.content_key()
+            clone = chromosome.clone()
+
+            self.assertIsInstance(clone, chromosome_cls)
+            self.assertEqual(clone.content_key(), key)
+            for (gene, cloned_gene) in zip(chromosome.genotypes,
+                                           clone.genotypes):
+                self.assertIsNot(cloned_gene, gene)
+
+            # Changing the clone leaves the original alone
+            genes = clone.genotypes
+            genes.reverse()
+            clone.genotypes = genes
+            self.assertEqual(chromosome.content_key(), key)
+
+
+if __name__ == '__main__':
+    unittest.main()
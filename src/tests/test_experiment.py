@@ -0,0 +1,39 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
+from io import StringIO
+from unittest.mock import MagicMock, patch
+
+from genetic_framework.population import Population
+from tests.test_islands import function_min_experiment
+
+
+class FitnessWorkersTest(unittest.TestCase):
+    def setUp(self) -> None:
+        # Threads stand in for the spawned worker processes
+        self.executor = MagicMock(wraps=ThreadPoolExecutor(2))
+
+    def run_with_workers(self) -> None:
+        experiment = function_min_experiment(20, 5, 10**6)
+        experiment.fitness_workers = 2
+        with patch('genetic_framework.experiment.ProcessPoolExecutor',
+                   return_value=self.executor), redirect_stdout(StringIO()):
+            experiment.run_experiment(interactive=False)
+
+    def test_workers_shut_down_after_run(self) -> None:
+        self.run_with_workers()
+
+        self.assertTrue(self.executor.map.called)
+        self.executor.shutdown.assert_called_once()
+
+    def test_workers_shut_down_on_interrupt(self) -> None:
+        with patch.object(Population, 'evolve',
+                          side_effect=KeyboardInterrupt):
+            with self.assertRaises(KeyboardInterrupt):
+                self.run_with_workers()
+
+        self.executor.shutdown.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+import unittest
+
+import numpy as np  #type: ignore
+
+from function_minimization.chromosomes import FloatVectorChromosome
+from function_minimization.fitness import ChallengeFitnessComputer
+
+CUSTOM_DATA = dict(parameter_lower_bound=-2.048,
+                   parameter_upper_bound=2.048,
+                   vector_size=5)
+
+
+class ChallengeFitnessComputerTest(unittest.TestCase):
+    def test_batch_matches_fitness(self) -> None:
+        chromosomes = FloatVectorChromosome.initialize_batch(50, CUSTOM_DATA)
+
+        np.testing.assert_allclose(
+            ChallengeFitnessComputer.fitness_batch(chromosomes), [
+                ChallengeFitnessComputer.fitness(chromosome)
+                for chromosome in chromosomes
+            ])
+        # The per-chromosome default of FitnessComputer
+        np.testing.assert_allclose(
+            ChallengeFitnessComputer.fitness_batch(chromosomes),
+            super(ChallengeFitnessComputer,
+                  ChallengeFitnessComputer).fitness_batch(chromosomes))
+
+    def test_known_values(self) -> None:
+        chromosomes = FloatVectorChromosome.from_rows(
+            CUSTOM_DATA, np.array([[1.0] * 5, [0.0] * 5, [-1.0] * 5]))
+
+        self.assertEqual(
+            ChallengeFitnessComputer.fitness_batch(chromosomes).tolist(),
+            [0.0, 4.0, 1616.0])
+
+    def test_empty_batch(self) -> None:
+        self.assertEqual(ChallengeFitnessComputer.fitness_batch([]).shape,
+                         (0, ))
+
+
+class StackTest(unittest.TestCase):
+    def test_stack_copies_rows(self) -> None:
+        chromosomes = FloatVectorChromosome.initialize_batch(3, CUSTOM_DATA)
+        genes = FloatVectorChromosome.stack(chromosomes)
+
+        self.assertEqual(genes.shape, (3, 5))
+        self.assertEqual(genes.dtype, np.float64)
+        for (row, chromosome) in zip(genes, chromosomes):
+            np.testing.assert_array_equal(row, chromosome.data)
+
+        genes[:] = 0.0
+        self.assertFalse(np.all(chromosomes[0].data == 0.0))
+
+
+if __name__ == '__main__':
+    unittest.main()
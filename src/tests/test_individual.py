@@ -0,0 +1,153 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+from typing import List, Type
+
+import numpy as np  #type: ignore
+
+from function_minimization.chromosomes import FloatVectorChromosome
+from function_minimization.mutators import RandomizeGeneMutator
+from function_minimization.recombiners import RandomInterpolationRecombiner
+from genetic_framework.fitness import FitnessComputer
+from genetic_framework.individual import Individual, batch_fitness
+
+CUSTOM_DATA = dict(parameter_lower_bound=-10.0,
+                   parameter_upper_bound=10.0,
+                   vector_size=2)
+
+
+class OffsetSumFitnessComputer(FitnessComputer[FloatVectorChromosome]):
+    """Sum of the genes plus the offset in custom_data, counting calls."""
+    calls = 0
+
+    @classmethod
+    def fitness(cls: Type, chromosome: FloatVectorChromosome) -> float:
+        cls.calls += 1
+        offset: float = cls.custom_data['offset']
+        return float(np.sum(chromosome.data)) + offset
+
+
+def individuals(values: List[float]) -> List[Individual]:
+    """Individuals whose genes are all equal to each of the values."""
+    return [
+        Individual(FloatVectorChromosome,
+                   OffsetSumFitnessComputer,
+                   RandomizeGeneMutator,
+                   RandomInterpolationRecombiner,
+                   chromosome=FloatVectorChromosome.from_data(
+                       CUSTOM_DATA, np.full(2, value)))
+        for value in values
+    ]
+
+
+class BatchFitnessTest(unittest.TestCase):
+    def setUp(self) -> None:
+        OffsetSumFitnessComputer.set_custom_data({'offset': 0.5})
+        OffsetSumFitnessComputer.calls = 0
+
+    def test_matches_scalar_fitness(self) -> None:
+        values = np.random.default_rng(0).uniform(-10.0, 10.0, 50).tolist()
+        population = individuals(values)
+        fits = batch_fitness(population)
+
+        self.assertEqual(fits.dtype, np.float64)
+        np.testing.assert_allclose(fits, [
+            OffsetSumFitnessComputer.fitness(individual.chromosome)
+            for individual in individuals(values)
+        ])
+        np.testing.assert_allclose(
+            OffsetSumFitnessComputer.fitness_batch(
+                [individual.chromosome for individual in population]), fits)
+        # Fitnesses are stored on the individuals
+        calls = OffsetSumFitnessComputer.calls
+        self.assertEqual(
+            [individual.fitness() for individual in population],
+            fits.tolist())
+        self.assertEqual(OffsetSumFitnessComputer.calls, calls)
+
+    def test_skips_evaluated_individuals(self) -> None:
+        population = individuals([1.0, 2.0, 3.0])
+        population[1].fitness()
+        calls = OffsetSumFitnessComputer.calls
+
+        self.assertEqual(batch_fitness(population).tolist(), [2.5, 4.5, 6.5])
+        self.assertEqual(OffsetSumFitnessComputer.calls - calls, 2)
+        self.assertEqual(batch_fitness([]).shape, (0, ))
+
+    def test_executor_chunks_match_serial(self) -> None:
+        values = np.random.default_rng(1).uniform(-10.0, 10.0, 10).tolist()
+        serial = batch_fitness(individuals(values))
+
+        with ThreadPoolExecutor(2) as executor:
+            for num_chunks in (2, 3, 20):
+                # Same offset, new custom_data version: nothing from the cache
+                OffsetSumFitnessComputer.set_custom_data({'offset': 0.5})
+                np.testing.assert_allclose(
+                    batch_fitness(individuals(values), executor, num_chunks),
+                    serial)
+
+
+class DeduplicationTest(unittest.TestCase):
+    def setUp(self) -> None:
+        OffsetSumFitnessComputer.set_custom_data({'offset': 0.0})
+        OffsetSumFitnessComputer.calls = 0
+
+    def test_equal_chromosomes_are_evaluated_once(self) -> None:
+        population = individuals([1.0, 2.0, 1.0, 1.0, 2.0])
+        total = Individual.total_fitness_computed
+
+        self.assertEqual(
+            batch_fitness(population).tolist(), [2.0, 4.0, 2.0, 2.0, 4.0])
+        self.assertEqual(OffsetSumFitnessComputer.calls, 2)
+        self.assertEqual(Individual.total_fitness_computed - total, 2)
+        # Only the first individual of every group counts the computation
+        self.assertEqual(
+            [individual.num_fitness_computed for individual in population],
+            [1, 1, 0, 0, 0])
+
+    def test_keyless_individuals_are_evaluated_each(self) -> None:
+        population = individuals([1.0, 2.0, 1.0])
+        total = Individual.total_fitness_computed
+
+        with mock.patch('genetic_framework.individual.FITNESS_CACHE_ENABLED',
+                        False):
+            self.assertEqual(
+                batch_fitness(population).tolist(), [2.0, 4.0, 2.0])
+        self.assertEqual(OffsetSumFitnessComputer.calls, 3)
+        self.assertEqual(Individual.total_fitness_computed - total, 3)
+        self.assertEqual(
+            [individual.num_fitness_computed for individual in population],
+            [1, 1, 1])
+
+
+class FitnessCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        OffsetSumFitnessComputer.set_custom_data({'offset': 0.0})
+        OffsetSumFitnessComputer.calls = 0
+
+    def test_cache_hits_are_not_computations(self) -> None:
+        first = individuals([1.0, 2.0])
+        total = Individual.total_fitness_computed
+        self.assertEqual(batch_fitness(first).tolist(), [2.0, 4.0])
+        self.assertEqual(Individual.total_fitness_computed - total, 2)
+
+        # Same genes again, from the shared cache
+        total = Individual.total_fitness_computed
+        self.assertEqual(
+            [individual.fitness() for individual in individuals([2.0, 1.0])],
+            [4.0, 2.0])
+        self.assertEqual(Individual.total_fitness_computed, total)
+        self.assertEqual(OffsetSumFitnessComputer.calls, 2)
+
+    def test_new_custom_data_misses_cache(self) -> None:
+        self.assertEqual(batch_fitness(individuals([1.0])).tolist(), [2.0])
+
+        OffsetSumFitnessComputer.set_custom_data({'offset': 10.0})
+        total = Individual.total_fitness_computed
+        self.assertEqual(batch_fitness(individuals([1.0])).tolist(), [12.0])
+        self.assertEqual(individuals([1.0])[0].fitness(), 12.0)
+        self.assertEqual(Individual.total_fitness_computed - total, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
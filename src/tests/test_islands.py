@@ -0,0 +1,159 @@
+import sys
+import unittest
+from typing import List
+from contextlib import redirect_stdout
+from io import StringIO
+from os.path import dirname
+from queue import Queue
+from subprocess import run, DEVNULL, PIPE
+
+from function_minimization.chromosomes import FloatVectorChromosome
+from function_minimization.fitness import ChallengeFitnessComputer
+from function_minimization.mutators import RandomizeGeneMutator
+from function_minimization.recombiners import RandomInterpolationRecombiner
+from function_minimization.selectors import MinimizeFitnessMatingSelector, MinimizeFitnessSurvivorSelector, KLowerFitnessSolutionSelector
+from genetic_framework.experiment import Experiment
+from genetic_framework.individual import Individual
+from genetic_framework.islands import IslandExperiment, run_island
+from genetic_framework.statistics import BestFitnessPerGenerationStatisticsCollector
+
+
+def function_min_experiment(population_size: int, max_generations: int,
+                            max_fitness_computations: int) -> Experiment:
+    return Experiment(
+        population_size, max_generations, 0.9, 0.3, None, 3, 2,
+        max_fitness_computations, 5, None, FloatVectorChromosome,
+        ChallengeFitnessComputer, False, RandomizeGeneMutator,
+        RandomInterpolationRecombiner, MinimizeFitnessMatingSelector,
+        MinimizeFitnessSurvivorSelector, KLowerFitnessSolutionSelector,
+        [BestFitnessPerGenerationStatisticsCollector],
+        dict(parameter_lower_bound=-2.048,
+             parameter_upper_bound=2.048,
+             vector_size=2))
+
+
+class IslandExperimentTest(unittest.TestCase):
+    def run_islands(self, islands: IslandExperiment):
+        with redirect_stdout(StringIO()):
+            return islands.run_experiment()
+
+    def test_two_islands_stop_at_split_budget(self) -> None:
+        islands = IslandExperiment(function_min_experiment(40, 200, 300), 2,
+                                   migration_interval=2)
+        self.assertEqual(islands.island_experiment.population_size, 20)
+        self.assertEqual(islands.island_experiment.max_fitness_computations,
+                         150)
+
+        # Island 0 run in this process, where its computations can be
+        # counted: it stops at its own 150 computations budget, overshooting
+        # by less than a generation (2 parent pairs breeding 2 children
+        # each), long before max_generations
+        computed = Individual.total_fitness_computed
+        with redirect_stdout(StringIO()):
+            _, (best_per_generation, ) = run_island(
+                islands.island_experiment, 0, [Queue(), Queue()], 2, 1, True)
+        computed = Individual.total_fitness_computed - computed
+        self.assertGreaterEqual(computed, 150)
+        self.assertLess(computed, 150 + 2 * 2)
+        self.assertLess(len(best_per_generation.data), 200)
+
+        self.run_islands(islands)
+        self.assertEqual(len(islands.island_statistics), 2)
+
+    def test_best_individuals_merged_from_islands(self) -> None:
+        islands = IslandExperiment(function_min_experiment(40, 10, 10**6), 2,
+                                   migration_interval=2)
+        best_individuals, _ = self.run_islands(islands)
+
+        fits = [individual.fitness() for individual in best_individuals]
+        self.assertEqual(len(fits), 3)
+        self.assertEqual(fits, sorted(fits))
+
+        islands_best = [
+            best_per_generation.data[-1][1]
+            for (best_per_generation, ) in islands.island_statistics
+        ]
+        self.assertEqual(fits[0], min(islands_best))
+
+    def test_island_share_of_experiment(self) -> None:
+        experiment = function_min_experiment(100, 10, 10000)
+        island_experiment = IslandExperiment(experiment,
+                                             3).island_experiment
+
+        self.assertEqual(island_experiment.population_size, 33)
+        self.assertEqual(island_experiment.max_fitness_computations, 3333)
+        self.assertEqual(island_experiment.num_parent_pairs, 1)
+        # The experiment itself is left untouched
+        self.assertEqual(experiment.population_size, 100)
+        self.assertEqual(experiment.num_parent_pairs, 5)
+
+    def test_island_share_lower_bounds(self) -> None:
+        island_experiment = IslandExperiment(function_min_experiment(3, 10, 3),
+                                             4).island_experiment
+
+        self.assertEqual(island_experiment.population_size, 2)
+        self.assertEqual(island_experiment.max_fitness_computations, 1)
+        self.assertEqual(island_experiment.num_parent_pairs, 1)
+
+    def test_needs_two_islands(self) -> None:
+        with self.assertRaises(ValueError):
+            IslandExperiment(function_min_experiment(40, 10, 100), 1)
+
+
+class IslandTopologyTest(unittest.TestCase):
+    def run_middle_island(self, ring: bool) -> List[Queue]:
+        """Runs island 1 of 3 for 3 generations in this process, migrating
+        its 2 best individuals every generation, and returns the queues."""
+        queues: List[Queue] = [Queue() for _ in range(3)]
+        with redirect_stdout(StringIO()):
+            run_island(function_min_experiment(10, 3, 10**6), 1, queues, 1, 2,
+                       ring)
+        return queues
+
+    def test_ring_sends_to_next_island(self) -> None:
+        queues = self.run_middle_island(True)
+
+        self.assertTrue(queues[0].empty())
+        self.assertEqual(queues[2].qsize(), 3)
+        while not queues[2].empty():
+            self.assertEqual(len(queues[2].get()), 2)
+
+    def test_random_never_sends_to_itself(self) -> None:
+        queues = self.run_middle_island(False)
+
+        self.assertTrue(queues[1].empty())
+        self.assertEqual(queues[0].qsize() + queues[2].qsize(), 3)
+
+    def test_statistics_of_every_island(self) -> None:
+        islands = IslandExperiment(function_min_experiment(30, 5, 10**6), 3,
+                                   migration_interval=1,
+                                   ring=True)
+        with redirect_stdout(StringIO()):
+            _, statistics = islands.run_experiment()
+
+        self.assertEqual(len(islands.island_statistics), 3)
+        self.assertIs(statistics, islands.island_statistics[0])
+        for (best_per_generation, ) in islands.island_statistics:
+            self.assertEqual(len(best_per_generation.data), 5)
+
+
+class IslandsCLITest(unittest.TestCase):
+    def test_cli_runs_islands(self) -> None:
+        # Default population and parents split over 2 islands
+        result = run([
+            sys.executable, 'run_function_min.py', '-ni', '2', '-mg', '3',
+            '-pl', '0'
+        ],
+                     cwd=dirname(dirname(__file__)),
+                     stdin=DEVNULL,
+                     stdout=PIPE,
+                     stderr=PIPE,
+                     universal_newlines=True)
+
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertIn("'num_islands': 2", result.stdout)
+        self.assertIn('Solutions', result.stdout)
+
+
+if __name__ == '__main__':
+    unittest.main()
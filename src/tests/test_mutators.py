@@ -0,0 +1,101 @@
+import random
+import unittest
+from collections import Counter
+from typing import List, Optional, Tuple, Type
+
+import numpy as np  #type: ignore
+
+from eight_queens.chromosomes import IntPermutationChromosome
+from genetic_framework.chromosome import Chromosome
+from genetic_framework.mutator import Mutator, SwapGeneMutator, SwapGeneRangeMutator
+
+CUSTOM_DATA = {'chess_size': 4}
+DRAWS = 20000
+
+
+def values(chromosome: Chromosome) -> List[int]:
+    return [gene.data for gene in chromosome.genotypes]
+
+
+def changed_range(before: List[int],
+                  after: List[int]) -> Optional[Tuple[int, int]]:
+    """First and last positions whose values changed, None if none did."""
+    changed = [i for i in range(len(before)) if before[i] != after[i]]
+    return (changed[0], changed[-1]) if len(changed) > 0 else None
+
+
+class SwapMutatorsTest(unittest.TestCase):
+    def setUp(self) -> None:
+        random.seed(0)
+        self.rng = np.random.default_rng(0)
+        self.originals = IntPermutationChromosome.initialize_batch(
+            DRAWS, CUSTOM_DATA)
+        self.before = [values(chromosome) for chromosome in self.originals]
+
+    def mutate(self, mutator_cls: Type[Mutator],
+               batch: bool) -> List[List[int]]:
+        """Mutates fresh copies of the original chromosomes through
+        mutate_batch_inplace or mutate_inplace, returning their values."""
+        chromosomes: List[Chromosome] = [
+            chromosome.clone() for chromosome in self.originals
+        ]
+        if batch:
+            mutator_cls.mutate_batch_inplace(chromosomes, self.rng)
+        else:
+            for chromosome in chromosomes:
+                mutator_cls.mutate_inplace(chromosome)
+        return [values(chromosome) for chromosome in chromosomes]
+
+    def assert_same_frequencies(self, batch: List, scalar: List) -> None:
+        batch_counts = Counter(batch)
+        scalar_counts = Counter(scalar)
+        self.assertEqual(set(batch_counts), set(scalar_counts))
+        for key in scalar_counts:
+            self.assertAlmostEqual(batch_counts[key] / len(batch),
+                                   scalar_counts[key] / len(scalar),
+                                   delta=0.02)
+
+    def test_swap_gene_batch(self) -> None:
+        after = self.mutate(SwapGeneMutator, True)
+
+        for (old, new) in zip(self.before, after):
+            (i, j) = changed_range(old, new)  # type: ignore
+            # Exactly two positions swapped
+            self.assertEqual(sum(a != b for (a, b) in zip(old, new)), 2)
+            self.assertEqual((new[i], new[j]), (old[j], old[i]))
+
+        # Every pair of positions as likely as with mutate_inplace
+        scalar = self.mutate(SwapGeneMutator, False)
+        self.assert_same_frequencies(
+            [changed_range(*pair) for pair in zip(self.before, after)],
+            [changed_range(*pair) for pair in zip(self.before, scalar)])
+
+    def test_swap_gene_range_batch(self) -> None:
+        after = self.mutate(SwapGeneRangeMutator, True)
+
+        for (old, new) in zip(self.before, after):
+            changed = changed_range(old, new)
+            if changed is None:
+                continue
+            # A single contiguous range reversed
+            (l, r) = changed
+            self.assertEqual(new, old[:l] + old[l:r + 1][::-1] + old[r + 1:])
+
+        # Ranges as likely as with mutate_inplace (None for length 1 ones)
+        scalar = self.mutate(SwapGeneRangeMutator, False)
+        self.assert_same_frequencies(
+            [changed_range(*pair) for pair in zip(self.before, after)],
+            [changed_range(*pair) for pair in zip(self.before, scalar)])
+
+    def test_single_gene_is_left_alone(self) -> None:
+        chromosomes: List[Chromosome] = list(
+            IntPermutationChromosome.initialize_batch(3, {'chess_size': 1}))
+        SwapGeneMutator.mutate_batch_inplace(chromosomes, self.rng)
+        SwapGeneRangeMutator.mutate_batch_inplace(chromosomes, self.rng)
+
+        self.assertEqual([values(chromosome) for chromosome in chromosomes],
+                         [[0]] * 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+from unittest.mock import patch
+
+import numpy as np  #type: ignore
+
+from function_minimization.chromosomes import FloatVectorChromosome
+from function_minimization.recombiners import UniformCrossoverRecombiner
+
+CUSTOM_DATA = dict(parameter_lower_bound=-10.0,
+                   parameter_upper_bound=10.0,
+                   vector_size=6)
+
+
+class UniformCrossoverRecombinerTest(unittest.TestCase):
+    def setUp(self) -> None:
+        # Parents of every couple don't share any gene value
+        genes = np.linspace(0.1, 1.0, 6)
+        self.couples = [
+            (FloatVectorChromosome.from_data(CUSTOM_DATA, genes + i),
+             FloatVectorChromosome.from_data(CUSTOM_DATA, -genes - i))
+            for i in range(5)
+        ]
+
+    def assert_genes_from_parents(self, child: FloatVectorChromosome,
+                                  parent1: FloatVectorChromosome,
+                                  parent2: FloatVectorChromosome) -> None:
+        self.assertEqual(child.data.shape, parent1.data.shape)
+        self.assertTrue(
+            np.all((child.data == parent1.data)
+                   | (child.data == parent2.data)))
+
+    def test_recombine_genes_from_parents(self) -> None:
+        for (parent1, parent2) in self.couples:
+            child = UniformCrossoverRecombiner.recombine(parent1, parent2)
+            self.assert_genes_from_parents(child, parent1, parent2)
+
+    def test_recombine_batch_genes_from_parents(self) -> None:
+        children = UniformCrossoverRecombiner.recombine_batch(self.couples)
+
+        self.assertEqual(len(children), len(self.couples))
+        for (child, (parent1, parent2)) in zip(children, self.couples):
+            self.assert_genes_from_parents(child, parent1, parent2)
+            # Own genes, not a view keeping the batch matrix alive
+            self.assertIsNone(child.data.base)
+
+    def test_batch_matches_recombine(self) -> None:
+        # Same random stream for both paths: the batch draws the masks of
+        # every child at once, in the same order recombine draws them
+        with patch('function_minimization.recombiners.shared_rng',
+                   np.random.default_rng(42)):
+            children = [
+                UniformCrossoverRecombiner.recombine(parent1, parent2)
+                for (parent1, parent2) in self.couples
+            ]
+        batch_children = UniformCrossoverRecombiner.recombine_batch(
+            self.couples, np.random.default_rng(42))
+
+        for (child, batch_child) in zip(children, batch_children):
+            np.testing.assert_array_equal(child.data, batch_child.data)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+import random
+import unittest
+from typing import List
+from contextlib import redirect_stdout
+from io import StringIO
+
+import numpy as np  #type: ignore
+
+from function_minimization.chromosomes import FloatVectorChromosome
+from function_minimization.fitness import ChallengeFitnessComputer
+from function_minimization.mutators import RandomizeGeneMutator
+from function_minimization.recombiners import RandomInterpolationRecombiner
+from genetic_framework.individual import Individual
+from genetic_framework.population import Population
+from genetic_framework.rng import rng, scalar_random, seed
+from genetic_framework.selectors import RandomMatingSelector, RouletteSurvivorSelector
+from tests.test_islands import function_min_experiment
+
+CUSTOM_DATA = dict(parameter_lower_bound=-2.048,
+                   parameter_upper_bound=2.048,
+                   vector_size=4)
+
+
+class SeedTest(unittest.TestCase):
+    def tearDown(self) -> None:
+        seed(None)
+
+    def test_seed_repeats_draws(self) -> None:
+        seed(7)
+        draws = (rng.random(3).tolist(), scalar_random.random(),
+                 random.random())
+        seed(7)
+        self.assertEqual((rng.random(3).tolist(), scalar_random.random(),
+                          random.random()), draws)
+
+    def test_seed_repeats_experiment(self) -> None:
+        results = []
+        for _ in range(2):
+            seed(7)
+            with redirect_stdout(StringIO()):
+                best_individuals, _ = function_min_experiment(
+                    20, 10, 10**6).run_experiment(interactive=False)
+            results.append(
+                [individual.chromosome.data.tolist()
+                 for individual in best_individuals])
+
+        self.assertEqual(results[0], results[1])
+
+
+class PopulationRngTest(unittest.TestCase):
+    def setUp(self) -> None:
+        RandomizeGeneMutator.set_custom_data(CUSTOM_DATA)
+        self.individuals = [
+            Individual(FloatVectorChromosome, ChallengeFitnessComputer,
+                       RandomizeGeneMutator, RandomInterpolationRecombiner,
+                       chromosome=chromosome)
+            for chromosome in FloatVectorChromosome.initialize_batch(
+                20, CUSTOM_DATA)
+        ]
+
+    def evolve(self, population_rng: np.random.Generator) -> List[List[float]]:
+        population = Population(list(self.individuals), 0.9, 0.5, 2, 5,
+                                False, RandomMatingSelector,
+                                RouletteSurvivorSelector,
+                                rng=population_rng)
+        for _ in range(5):
+            population.evolve()
+        return [
+            individual.chromosome.data.tolist()
+            for individual in population.population
+        ]
+
+    def test_population_draws_from_own_rng(self) -> None:
+        shared_state = rng.bit_generator.state
+        genes = self.evolve(np.random.default_rng(3))
+
+        # Selectors and batch operators drew from the population's rng only
+        self.assertEqual(rng.bit_generator.state, shared_state)
+        self.assertEqual(self.evolve(np.random.default_rng(3)), genes)
+        self.assertNotEqual(self.evolve(np.random.default_rng(4)), genes)
+
+
+if __name__ == '__main__':
+    unittest.main()
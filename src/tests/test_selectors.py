@@ -0,0 +1,180 @@
+import unittest
+from typing import List
+
+import numpy as np  #type: ignore
+
+from function_minimization.chromosomes import FloatVectorChromosome
+from function_minimization.fitness import ChallengeFitnessComputer
+from function_minimization.mutators import RandomizeGeneMutator
+from function_minimization.recombiners import RandomInterpolationRecombiner
+from function_minimization.selectors import KLowerFitnessSolutionSelector
+from genetic_framework.individual import Individual
+from genetic_framework.selectors import BestFromRandomMatingSelector, TournamentMatingSelector, KBestFitnessSolutionSelector
+
+CUSTOM_DATA = dict(parameter_lower_bound=-2.048,
+                   parameter_upper_bound=2.048,
+                   vector_size=2)
+
+
+def function_min_individuals(values: List[float]) -> List[Individual]:
+    """Individuals whose genes are all equal to each of the values."""
+    return [
+        Individual(FloatVectorChromosome,
+                   ChallengeFitnessComputer,
+                   RandomizeGeneMutator,
+                   RandomInterpolationRecombiner,
+                   chromosome=FloatVectorChromosome.from_data(
+                       CUSTOM_DATA, np.full(2, value)))
+        for value in values
+    ]
+
+
+class TournamentMatingSelectorTest(unittest.TestCase):
+    def setUp(self) -> None:
+        # Fitnesses 1, 0, 404 and 401
+        self.population = function_min_individuals([0.0, 1.0, -1.0, 2.0])
+
+    def tearDown(self) -> None:
+        TournamentMatingSelector.set_custom_data({})
+
+    def test_tournament_size_from_custom_data(self) -> None:
+        TournamentMatingSelector.set_custom_data({'tournament_size': 5})
+        self.assertEqual(TournamentMatingSelector.tournament_size, 5)
+
+        TournamentMatingSelector.set_custom_data({})
+        self.assertEqual(TournamentMatingSelector.tournament_size, 3)
+
+    def test_returns_num_pairs_couples(self) -> None:
+        couples = TournamentMatingSelector.select_couples(
+            self.population, 7, False)
+
+        self.assertEqual(len(couples), 7)
+        for couple in couples:
+            for individual in couple:
+                self.assertIn(individual, self.population)
+
+    def test_picks_lowest_fitness_when_minimizing(self) -> None:
+        # Tournaments larger than the population take everyone, so the best
+        # individual always wins the first one and the second best the other
+        TournamentMatingSelector.set_custom_data({'tournament_size': 200})
+        couples = TournamentMatingSelector.select_couples(
+            self.population, 5, False)
+
+        self.assertEqual(len(couples), 5)
+        for (mate1, mate2) in couples:
+            self.assertIs(mate1, self.population[1])
+            self.assertIs(mate2, self.population[0])
+
+    def test_picks_highest_fitness_when_maximizing(self) -> None:
+        TournamentMatingSelector.set_custom_data({'tournament_size': 200})
+        couples = TournamentMatingSelector.select_couples(
+            self.population, 5, True)
+
+        self.assertEqual(len(couples), 5)
+        for (mate1, mate2) in couples:
+            self.assertIs(mate1, self.population[2])
+            self.assertIs(mate2, self.population[3])
+
+    def test_mates_are_distinct(self) -> None:
+        population = function_min_individuals(list(np.linspace(-1, 1, 10)))
+        for tournament_size in (1, 3, 9, 10):
+            TournamentMatingSelector.set_custom_data(
+                {'tournament_size': tournament_size})
+            for (mate1, mate2) in TournamentMatingSelector.select_couples(
+                    population, 200, False):
+                self.assertIsNot(mate1, mate2)
+
+    def test_two_individuals_mate_together(self) -> None:
+        for (mate1, mate2) in TournamentMatingSelector.select_couples(
+                self.population[:2], 10, False):
+            self.assertEqual({id(mate1), id(mate2)},
+                             {id(individual)
+                              for individual in self.population[:2]})
+
+    def test_no_couples_from_single_individual(self) -> None:
+        self.assertEqual(
+            TournamentMatingSelector.select_couples(self.population[:1], 3,
+                                                    False), [])
+
+
+class BestFromRandomMatingSelectorTest(unittest.TestCase):
+    def test_picks_two_best_of_small_population(self) -> None:
+        # With up to 5 individuals every one of them is a candidate
+        population = function_min_individuals([0.0, 1.0, -1.0, 2.0])
+        couples = BestFromRandomMatingSelector.select_couples(
+            population, 6, False)
+
+        self.assertEqual(couples, [(population[1], population[0])] * 6)
+        self.assertEqual(
+            BestFromRandomMatingSelector.select_couples(population, 2, True),
+            [(population[2], population[3])] * 2)
+
+    def test_mates_are_distinct_candidates(self) -> None:
+        population = function_min_individuals(list(np.linspace(-1, 1, 30)))
+        fits = [individual.fitness() for individual in population]
+        couples = BestFromRandomMatingSelector.select_couples(
+            population, 300, False)
+
+        self.assertEqual(len(couples), 300)
+        for (mate1, mate2) in couples:
+            self.assertIsNot(mate1, mate2)
+            self.assertLessEqual(mate1.fitness(), mate2.fitness())
+            # The second mate is the best of 5 but one, so at least 3
+            # individuals are worse than it
+            self.assertGreaterEqual(
+                sum(fit > mate2.fitness() for fit in fits), 3)
+        # Candidates are drawn at random, not always the same ones
+        self.assertGreater(len({id(mate1) for (mate1, _) in couples}), 1)
+
+
+class KBestFitnessSolutionSelectorTest(unittest.TestCase):
+    def test_keeps_best_individuals(self) -> None:
+        selector = KBestFitnessSolutionSelector(2, True)
+        population = function_min_individuals([0.0, 1.0, -1.0, 2.0])
+        selector.update_individuals(population)
+
+        self.assertEqual(
+            [individual.fitness() for individual in selector.best_individuals],
+            [404.0, 401.0])
+
+    def test_kept_individuals_win_ties(self) -> None:
+        selector = KBestFitnessSolutionSelector(3, False)
+        selector.update_individuals(function_min_individuals([1.0] * 3))
+        kept = list(selector.best_individuals)
+
+        # Many newcomers tied with the kept individuals at the k-th fitness
+        selector.update_individuals(function_min_individuals([1.0] * 200))
+
+        self.assertEqual(len(selector.best_individuals), 3)
+        for (individual, kept_individual) in zip(selector.best_individuals,
+                                                 kept):
+            self.assertIs(individual, kept_individual)
+
+
+class KLowerFitnessSolutionSelectorTest(unittest.TestCase):
+    def test_keeps_lowest_fitness_first(self) -> None:
+        selector = KLowerFitnessSolutionSelector(3, False)
+        population = function_min_individuals([0.0, 1.0, -1.0, 2.0])
+        selector.update_individuals(population)
+
+        self.assertIs(selector.best_individual, population[1])
+        self.assertEqual(
+            [individual.fitness() for individual in selector.best_individuals],
+            [0.0, 1.0, 401.0])
+
+    def test_kept_individuals_win_ties(self) -> None:
+        selector = KLowerFitnessSolutionSelector(3, False)
+        selector.update_individuals(function_min_individuals([0.0, 1.0, 1.0]))
+        kept = list(selector.best_individuals)
+
+        # Newcomers tied with the k-th kept individual
+        selector.update_individuals(function_min_individuals([0.0] * 200))
+
+        self.assertEqual(len(selector.best_individuals), 3)
+        for (individual, kept_individual) in zip(selector.best_individuals,
+                                                 kept):
+            self.assertIs(individual, kept_individual)
+
+
+if __name__ == '__main__':
+    unittest.main()
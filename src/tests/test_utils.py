@@ -0,0 +1,92 @@
+import unittest
+from collections import Counter
+from typing import List
+
+import numpy as np  #type: ignore
+
+from genetic_framework.individual import Individual
+from genetic_framework.utils import Roulette, k_best_indices
+from tests.test_selectors import function_min_individuals
+
+
+class KBestIndicesTest(unittest.TestCase):
+    def test_best_first(self) -> None:
+        fits = np.array([5.0, 1.0, 4.0, 2.0, 3.0])
+
+        self.assertEqual(k_best_indices(fits, 3, False).tolist(), [1, 3, 4])
+        self.assertEqual(k_best_indices(fits, 3, True).tolist(), [0, 2, 4])
+
+    def test_ties_taken_in_index_order(self) -> None:
+        # Enough equal values for an unstable partition to reorder them
+        fits = np.concatenate([np.full(200, 1.0), [0.0, 2.0]])
+
+        self.assertEqual(
+            k_best_indices(fits, 5, False).tolist(), [200, 0, 1, 2, 3])
+        self.assertEqual(
+            k_best_indices(fits, 5, True).tolist(), [201, 0, 1, 2, 3])
+        self.assertEqual(
+            k_best_indices(np.full(200, 1.0), 7, False).tolist(),
+            list(range(7)))
+
+    def test_k_out_of_range(self) -> None:
+        fits = np.array([2.0, 1.0])
+
+        self.assertEqual(k_best_indices(fits, 0, False).tolist(), [])
+        self.assertEqual(k_best_indices(fits, 5, False).tolist(), [1, 0])
+
+
+class RouletteTest(unittest.TestCase):
+    def setUp(self) -> None:
+        # Fitnesses 0, 1, 404 and 401
+        self.population = function_min_individuals([1.0, 0.0, -1.0, 2.0])
+
+    def frequencies(self, draws: List[Individual]) -> List[float]:
+        counts = Counter(id(individual) for individual in draws)
+        return [
+            counts[id(individual)] / len(draws)
+            for individual in self.population
+        ]
+
+    def test_get_many_matches_get_individual(self) -> None:
+        # Both draw in proportion to fitness
+        expected = np.array([0.0, 1.0, 404.0, 401.0]) / 806.0
+        roulette = Roulette(self.population, True, True,
+                            np.random.default_rng(1))
+
+        np.testing.assert_allclose(
+            self.frequencies(roulette.get_many(20000)), expected, atol=0.02)
+        np.testing.assert_allclose(self.frequencies(
+            [roulette.get_individual() for _ in range(20000)]),
+                                   expected,
+                                   atol=0.02)
+
+    def test_get_many_without_replacement(self) -> None:
+        for _ in range(50):
+            roulette = Roulette(self.population, True)
+            mates = roulette.get_many(3)
+
+            # Distinct and weighted, the fitness 0 individual is never drawn
+            self.assertEqual(len({id(mate) for mate in mates}), 3)
+            self.assertNotIn(id(self.population[0]),
+                             {id(mate) for mate in mates})
+            # Drawn individuals leave the roulette
+            self.assertEqual(roulette.get_many(1), [self.population[0]])
+
+    def test_get_many_with_too_few_weighted(self) -> None:
+        roulette = Roulette(self.population, True)
+        self.assertEqual({id(mate)
+                          for mate in roulette.get_many(4)},
+                         {id(individual)
+                          for individual in self.population})
+
+        # Everyone has fitness 0, draws are uniform
+        population = function_min_individuals([1.0] * 4)
+        self.population = population
+        roulette = Roulette(population, True, True, np.random.default_rng(2))
+        np.testing.assert_allclose(self.frequencies(
+            roulette.get_many(20000)), [0.25] * 4,
+                                   atol=0.02)
+
+
+if __name__ == '__main__':
+    unittest.main()